@@ -5,40 +5,64 @@ Script to generate 2D analytical phantoms and their sinograms with added noise
 and then reconstruct using the regularised FISTA algorithm.
 
 """
+import os
 import numpy as np
+import matplotlib
+
+PLOT = not os.environ.get("TOMOBAR_BENCH")
+if not PLOT:
+    # benchmarking mode: no display backend, figures are never created
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 from tomophantom import TomoP2D
-import os
+import tempfile
 import tomophantom
 from tomophantom.qualitymetrics import QualityTools
 
 model = 4  # select a model
 N_size = 512  # set dimension of the phantom
+run_unregularised = False  # set True to also run FISTA without regularisation
 path = os.path.dirname(tomophantom.__file__)
 path_library2D = os.path.join(path, "phantomlib", "Phantom2DLibrary.dat")
-phantom_2D = TomoP2D.Model(model, N_size, path_library2D)
-
-plt.close("all")
-plt.figure(1)
-plt.rcParams.update({"font.size": 21})
-plt.imshow(phantom_2D, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("{}" "{}".format("2D Phantom using model no.", model))
+# the phantom and its sinogram are cached on disk to speed up repeated runs
+cache_path = os.path.join(
+    tempfile.gettempdir(), "tomobar_demo_model{}_{}".format(model, N_size)
+)
+if os.path.exists(cache_path + "_phantom.npy"):
+    phantom_2D = np.load(cache_path + "_phantom.npy")
+else:
+    phantom_2D = np.float32(TomoP2D.Model(model, N_size, path_library2D))
+    np.save(cache_path + "_phantom.npy", phantom_2D)
+
+if PLOT:
+    plt.close("all")
+    plt.figure(1)
+    plt.rcParams.update({"font.size": 21})
+    plt.imshow(phantom_2D, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("{}" "{}".format("2D Phantom using model no.", model))
 
 # create sinogram analytically
 angles_num = int(0.5 * np.pi * N_size)
 # angles number
-angles = np.linspace(0.0, 179.9, angles_num, dtype="float32")
-angles_rad = angles * (np.pi / 180.0)
+angles = np.linspace(0.0, 180.0, angles_num, endpoint=False, dtype="float32")
+angles_rad = angles * np.float32(np.pi / 180.0)  # keep angles in float32
 P = int(np.sqrt(2) * N_size)  # detectors
 
-sino_an = TomoP2D.ModelSino(model, N_size, P, angles, path_library2D)
-
-plt.figure(2)
-plt.rcParams.update({"font.size": 21})
-plt.imshow(sino_an, cmap="gray")
-plt.colorbar(ticks=[0, 150, 250], orientation="vertical")
-plt.title("{}" "{}".format("Analytical sinogram of model no.", model))
+sino_path = cache_path + "_sino_{}_{}_{}.npy".format(P, angles_num, angles[-1])
+if os.path.exists(sino_path):
+    sino_an = np.load(sino_path)
+else:
+    sino_an = TomoP2D.ModelSino(model, N_size, P, angles, path_library2D)
+    sino_an = np.ascontiguousarray(sino_an, dtype=np.float32)
+    np.save(sino_path, sino_an)
+
+if PLOT:
+    plt.figure(2)
+    plt.rcParams.update({"font.size": 21})
+    plt.imshow(sino_an, cmap="gray")
+    plt.colorbar(ticks=[0, 150, 250], orientation="vertical")
+    plt.title("{}" "{}".format("Analytical sinogram of model no.", model))
 
 indicesROI = phantom_2D > 0
 # %%
@@ -52,13 +76,14 @@ _noise_ = {
     "noise_seed": 0,
 }
 
-noisy_sino = artefacts_mix(sino_an, **_noise_)
+noisy_sino = artefacts_mix(sino_an, **_noise_).astype(np.float32, copy=False)
 
-plt.figure()
-plt.rcParams.update({"font.size": 21})
-plt.imshow(noisy_sino, cmap="gray")
-plt.colorbar(ticks=[0, 150, 250], orientation="vertical")
-plt.title("{}" "{}".format("Analytical noisy sinogram", model))
+if PLOT:
+    plt.figure()
+    plt.rcParams.update({"font.size": 21})
+    plt.imshow(noisy_sino, cmap="gray")
+    plt.colorbar(ticks=[0, 150, 250], orientation="vertical")
+    plt.title("{}" "{}".format("Analytical noisy sinogram", model))
 # %%
 print("%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%")
 print("%%%%%%%%%%%%%%Reconstructing with FBP method %%%%%%%%%%%%%%%")
@@ -77,11 +102,12 @@ RectoolsDIR = RecToolsDIR(
 
 FBPrec = RectoolsDIR.FBP(noisy_sino)  # perform FBP reconstruction
 
-plt.figure()
-plt.rcParams.update({"font.size": 20})
-plt.imshow(FBPrec, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("FBP reconstruction")
+if PLOT:
+    plt.figure()
+    plt.rcParams.update({"font.size": 20})
+    plt.imshow(FBPrec, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("FBP reconstruction")
 # %%
 print("%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%")
 print("%%%%%%%%%%%%%%Reconstructing with SIRT method %%%%%%%%%%%%%%%")
@@ -105,11 +131,12 @@ _algorithm_ = {"iterations": 300}
 
 RecSIRT = Rectools.SIRT(_data_, _algorithm_)  # SIRT reconstruction
 
-plt.figure()
-plt.rcParams.update({"font.size": 20})
-plt.imshow(RecSIRT, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("SIRT reconstruction")
+if PLOT:
+    plt.figure()
+    plt.rcParams.update({"font.size": 20})
+    plt.imshow(RecSIRT, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("SIRT reconstruction")
 # %%
 print("%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%")
 print("Reconstructing with FISTA method (ASTRA used for projection)")
@@ -132,12 +159,15 @@ _data_ = {"projection_norm_data": noisy_sino}  # data dictionary
 lc = Rectools.powermethod(
     _data_
 )  # calculate Lipschitz constant (run once to initialise)
-_algorithm_ = {"iterations": 300, "lipschitz_const": lc}
-# Run FISTA reconstrucion algorithm without regularisation
-RecFISTA = Rectools.FISTA(_data_, _algorithm_)
-plt.figure()
-plt.imshow(RecFISTA, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+# FISTA is warm-started with the FBP reconstruction which needs fewer iterations
+_algorithm_ = {"iterations": 150, "lipschitz_const": lc, "initialise": FBPrec}
+if run_unregularised:
+    # Run FISTA reconstrucion algorithm without regularisation
+    RecFISTA = Rectools.FISTA(_data_, _algorithm_)
+    if PLOT:
+        plt.figure()
+        plt.imshow(RecFISTA, vmin=0, vmax=1, cmap="gray")
+        plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
 
 # adding regularisation using the CCPi regularisation toolkit
 _regularisation_ = {
@@ -149,23 +179,26 @@ _regularisation_ = {
 
 RecFISTA_reg = Rectools.FISTA(_data_, _algorithm_, _regularisation_)
 
-plt.figure()
-plt.subplot(121)
-plt.imshow(RecFISTA, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("FISTA reconstruction")
-plt.subplot(122)
-plt.imshow(RecFISTA_reg, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("Regularised FISTA reconstruction")
-plt.show()
+if PLOT:
+    plt.figure()
+    if run_unregularised:
+        plt.subplot(121)
+        plt.imshow(RecFISTA, vmin=0, vmax=1, cmap="gray")
+        plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+        plt.title("FISTA reconstruction")
+        plt.subplot(122)
+    plt.imshow(RecFISTA_reg, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("Regularised FISTA reconstruction")
+    plt.show()
 
 # calculate errors
-Qtools = QualityTools(phantom_2D[indicesROI], RecFISTA[indicesROI])
-RMSE_FISTA = Qtools.rmse()
+if run_unregularised:
+    Qtools = QualityTools(phantom_2D[indicesROI], RecFISTA[indicesROI])
+    RMSE_FISTA = Qtools.rmse()
+    print("RMSE for FISTA is {}".format(RMSE_FISTA))
 Qtools = QualityTools(phantom_2D[indicesROI], RecFISTA_reg[indicesROI])
 RMSE_FISTA_reg = Qtools.rmse()
-print("RMSE for FISTA is {}".format(RMSE_FISTA))
 print("RMSE for regularised FISTA is {}".format(RMSE_FISTA_reg))
 # %%
 print("%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%")
@@ -191,7 +224,8 @@ lc = Rectools.powermethod(
 )  # calculate Lipschitz constant (run once to initialise)
 
 # Run FISTA-OS reconstrucion algorithm without regularisation
-_algorithm_ = {"iterations": 30, "lipschitz_const": lc}
+# with 10 subsets it needs far fewer iterations than the classical FISTA above
+_algorithm_ = {"iterations": 20, "lipschitz_const": lc}
 RecFISTA_os = Rectools.FISTA(_data_, _algorithm_)
 #
 # adding regularisation
@@ -205,16 +239,17 @@ _regularisation_ = {
 # adding regularisation using the CCPi regularisation toolkit
 RecFISTA_os_reg = Rectools.FISTA(_data_, _algorithm_, _regularisation_)
 
-plt.figure()
-plt.subplot(121)
-plt.imshow(RecFISTA_os, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("FISTA-OS reconstruction")
-plt.subplot(122)
-plt.imshow(RecFISTA_os_reg, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("Regularised FISTA-OS reconstruction")
-plt.show()
+if PLOT:
+    plt.figure()
+    plt.subplot(121)
+    plt.imshow(RecFISTA_os, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("FISTA-OS reconstruction")
+    plt.subplot(122)
+    plt.imshow(RecFISTA_os_reg, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("Regularised FISTA-OS reconstruction")
+    plt.show()
 
 # calculate errors
 Qtools = QualityTools(phantom_2D[indicesROI], RecFISTA_os[indicesROI])
@@ -261,16 +296,17 @@ _regularisation_ = {
 # adding regularisation using the CCPi regularisation toolkit
 RecFISTA_os_kl_reg = Rectools.FISTA(_data_, _algorithm_, _regularisation_)
 
-plt.figure()
-plt.subplot(121)
-plt.imshow(RecFISTA_os_kl, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("FISTA-KL-OS reconstruction")
-plt.subplot(122)
-plt.imshow(RecFISTA_os_kl_reg, vmin=0, vmax=1, cmap="gray")
-plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
-plt.title("Regularised FISTA-KL-OS reconstruction")
-plt.show()
+if PLOT:
+    plt.figure()
+    plt.subplot(121)
+    plt.imshow(RecFISTA_os_kl, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("FISTA-KL-OS reconstruction")
+    plt.subplot(122)
+    plt.imshow(RecFISTA_os_kl_reg, vmin=0, vmax=1, cmap="gray")
+    plt.colorbar(ticks=[0, 0.5, 1], orientation="vertical")
+    plt.title("Regularised FISTA-KL-OS reconstruction")
+    plt.show()
 
 # calculate errors
 Qtools = QualityTools(phantom_2D[indicesROI], RecFISTA_os_kl[indicesROI])
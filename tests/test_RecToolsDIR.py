@@ -3,12 +3,29 @@ import numpy as np
 from numpy.testing import assert_allclose
 import pytest
 
-from tomobar.methodsDIR import RecToolsDIR
+from tomobar.methodsDIR import (
+    RecToolsDIR,
+    _filtersinc2D,
+    _filtersinc3D,
+    _sinc_filter,
+)
 from tomobar.supp.suppTools import normaliser
 
 eps = 1e-06
 
 
+def test_filtersinc3D_odd_width():
+    # the real FFT path must agree with the full FFT and with the 2D filter
+    rng = np.random.default_rng(0)
+    projection3D = rng.random((3, 30, 161), dtype=np.float32)
+    f = _sinc_filter(161, 30)
+    reference = np.real(np.fft.ifft(np.fft.fft(projection3D, axis=2) * f, axis=2))
+    filtered = _filtersinc3D(projection3D)
+    assert filtered.shape == (3, 30, 161)
+    assert_allclose(filtered, reference, rtol=0, atol=1e-07)
+    assert_allclose(filtered[1], _filtersinc2D(projection3D[1]), rtol=0, atol=1e-07)
+
+
 @pytest.mark.parametrize("processing_arch", ["cpu", "gpu"])
 def test_backproj2D(data, angles, processing_arch):
     detX = np.shape(data)[2]
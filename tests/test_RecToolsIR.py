@@ -3,6 +3,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 
 from tomobar.methodsIR import RecToolsIR
+from tomobar.methodsDIR import RecToolsDIR
 from tomobar.supp.suppTools import normaliser
 
 eps = 1e-06
@@ -399,6 +400,114 @@ def test_FISTA_OS_2D(data, angles):
     assert Iter_rec.shape == (160, 160)
 
 
+def test_FISTA_OS_CD_2D(data, angles):
+    detX = np.shape(data)[2]
+    detY = 0
+    data2D = data[:, 60, :]
+    N_size = detX
+    RecTools = RecToolsIR(
+        DetectorsDimH=detX,  # Horizontal detector dimension
+        DetectorsDimV=detY,  # Vertical detector dimension (3D case)
+        CenterRotOffset=0.0,  # Center of Rotation scalar or a vector
+        AnglesVec=angles,  # A vector of projection angles in radians
+        ObjSize=N_size,  # Reconstructed object dimensions (scalar)
+        datafidelity="LS",
+        device_projector=0,  # define the device
+    )
+    _data_ = {
+        "projection_norm_data": data2D,
+        "OS_number": 5,
+        "data_axes_labels_order": ["angles", "detX"],
+    }
+    # calculate Lipschitz constant
+    lc = RecTools.powermethod(_data_)
+
+    _algorithm_ = {"iterations": 5, "lipschitz_const": lc}
+    Iter_rec_regular = RecTools.FISTA(_data_, _algorithm_)
+    _algorithm_["fista_mode"] = "CD"
+    Iter_rec = RecTools.FISTA(_data_, _algorithm_)
+    assert -0.0050 <= np.min(Iter_rec) <= -0.0043
+    assert 0.0245 <= np.max(Iter_rec) <= 0.0265
+    # the Chambolle-Dossal momentum is smaller in the first iterations
+    assert np.max(np.abs(Iter_rec - Iter_rec_regular)) > 1e-03
+    assert Iter_rec.dtype == np.float32
+    assert Iter_rec.shape == (160, 160)
+
+
+def test_FISTA_restart_2D():
+    # the restart needs a well-conditioned problem and enough iterations for the
+    # momentum to overshoot, it is not triggered in a few iterations on real data
+    angles = np.linspace(0, np.pi, 40, endpoint=False, dtype=np.float32)
+    phantom = np.zeros((16, 16), dtype=np.float32)
+    phantom[4:12, 5:11] = 1.0
+    sinogram = RecToolsDIR(
+        DetectorsDimH=24,
+        DetectorsDimV=None,
+        CenterRotOffset=0.0,
+        AnglesVec=angles,
+        ObjSize=16,
+        device_projector=0,
+    ).FORWPROJ(phantom)
+    RecTools = RecToolsIR(
+        DetectorsDimH=24,  # Horizontal detector dimension
+        DetectorsDimV=0,  # Vertical detector dimension (3D case)
+        CenterRotOffset=0.0,  # Center of Rotation scalar or a vector
+        AnglesVec=angles,  # A vector of projection angles in radians
+        ObjSize=16,  # Reconstructed object dimensions (scalar)
+        datafidelity="LS",
+        device_projector=0,  # define the device
+    )
+    _data_ = {
+        "projection_norm_data": sinogram,
+        "data_axes_labels_order": ["angles", "detX"],
+    }
+    # calculate Lipschitz constant
+    lc = RecTools.powermethod(_data_)
+
+    _algorithm_ = {"iterations": 60, "lipschitz_const": lc}
+    Iter_rec_regular = RecTools.FISTA(_data_, _algorithm_)
+    _algorithm_["fista_mode"] = "restart"
+    Iter_rec = RecTools.FISTA(_data_, _algorithm_)
+    assert -0.05 <= np.min(Iter_rec) <= 0.0
+    assert 1.0 <= np.max(Iter_rec) <= 1.05
+    assert np.max(np.abs(Iter_rec - Iter_rec_regular)) > 1e-03
+    assert np.linalg.norm(Iter_rec - phantom) < 0.1 * np.linalg.norm(phantom)
+    assert Iter_rec.dtype == np.float32
+    assert Iter_rec.shape == (16, 16)
+
+
+def test_FISTA_OS_2D_reuse_atools(data, angles):
+    detX = np.shape(data)[2]
+    detY = 0
+    data2D = data[:, 60, :]
+    N_size = detX
+    RecTools = RecToolsIR(
+        DetectorsDimH=detX,  # Horizontal detector dimension
+        DetectorsDimV=detY,  # Vertical detector dimension (3D case)
+        CenterRotOffset=0.0,  # Center of Rotation scalar or a vector
+        AnglesVec=angles,  # A vector of projection angles in radians
+        ObjSize=N_size,  # Reconstructed object dimensions (scalar)
+        datafidelity="LS",
+        device_projector=0,  # define the device
+    )
+    _data_ = {
+        "projection_norm_data": data2D,
+        "OS_number": 5,
+        "data_axes_labels_order": ["angles", "detX"],
+    }
+    lc = RecTools.powermethod(_data_)
+    Atools_OS = RecTools.Atools
+
+    _algorithm_ = {"iterations": 5, "lipschitz_const": lc}
+    Iter_rec1 = RecTools.FISTA(_data_, _algorithm_)
+    Iter_rec2 = RecTools.FISTA(_data_, _algorithm_)
+    # the OS geometry and projectors are reused between the calls
+    assert RecTools.Atools is Atools_OS
+    assert_allclose(Iter_rec1, Iter_rec2, rtol=eps)
+    assert Iter_rec2.dtype == np.float32
+    assert Iter_rec2.shape == (160, 160)
+
+
 def test_FISTA_PWLS_OS_2D(angles, raw_data, flats, darks):
     normalised = normaliser(raw_data, flats, darks)
     raw_data_norm = np.float32(np.divide(raw_data, np.max(raw_data).astype(float)))
@@ -549,6 +658,68 @@ def test_ADMM2D(data, angles):
     assert Iter_rec.shape == (160, 160)
 
 
+# the options are compared against the plain ADMM (GMRES) with the same
+# regularisation, the deviation is the maximum absolute difference relative to
+# the plain maximum. The conjugate gradients should match within the tolerance of
+# the linear solvers
+@pytest.mark.parametrize(
+    "options, min_range, max_range, deviation_range",
+    [
+        (
+            {"ADMM_anderson_depth": 3},
+            (-0.0032, -0.0012),
+            (0.0220, 0.0255),
+            (0.05, 0.5),
+        ),
+        (
+            {"ADMM_rho_adaptive": True},
+            (-0.0035, -0.0015),
+            (0.0225, 0.0260),
+            (0.05, 0.5),
+        ),
+        (
+            {"ADMM_solver": "cg"},
+            (-0.0025, -0.0003),
+            (0.0200, 0.0222),
+            (0.0, 1e-04),
+        ),
+    ],
+)
+def test_ADMM_options_2D(data, angles, options, min_range, max_range, deviation_range):
+    detX = np.shape(data)[2]
+    detY = 0
+    data2D = data[:, 60, :]
+    N_size = detX
+    RecTools = RecToolsIR(
+        DetectorsDimH=detX,  # Horizontal detector dimension
+        DetectorsDimV=detY,  # Vertical detector dimension (3D case)
+        CenterRotOffset=0.0,  # Center of Rotation scalar or a vector
+        AnglesVec=angles,  # A vector of projection angles in radians
+        ObjSize=N_size,  # Reconstructed object dimensions (scalar)
+        datafidelity="LS",
+        device_projector=0,  # define the device
+    )
+    _data_ = {
+        "projection_norm_data": data2D,
+        "data_axes_labels_order": ["angles", "detX"],
+    }
+
+    _algorithm_ = {"iterations": 5, "ADMM_rho_const": 4000.0}
+    _regularisation_ = {"method": "PARALLEL_TV", "regul_param": 0.0001}
+
+    Iter_rec_plain = RecTools.ADMM(_data_, dict(_algorithm_), dict(_regularisation_))
+    _algorithm_.update(options)
+    Iter_rec = RecTools.ADMM(_data_, _algorithm_, _regularisation_)
+    assert min_range[0] <= np.min(Iter_rec) <= min_range[1]
+    assert max_range[0] <= np.max(Iter_rec) <= max_range[1]
+    atol = deviation_range[1] * np.max(Iter_rec_plain)
+    assert_allclose(Iter_rec, Iter_rec_plain, rtol=0, atol=atol)
+    deviation = np.max(np.abs(Iter_rec - Iter_rec_plain)) / np.max(Iter_rec_plain)
+    assert deviation >= deviation_range[0]
+    assert Iter_rec.dtype == np.float32
+    assert Iter_rec.shape == (160, 160)
+
+
 def test_ADMM3D(data, angles):
     detX = np.shape(data)[2]
     detY = np.shape(data)[1]
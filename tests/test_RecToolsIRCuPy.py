@@ -1,3 +1,4 @@
+import pytest
 import cupy as cp
 import numpy as np
 from numpy.testing import assert_allclose
@@ -282,6 +283,34 @@ def test_FISTA_OS_cp_3D(data_cupy, angles, ensure_clean_memory):
     assert Iter_rec.shape == (128, 160, 160)
 
 
+@pytest.mark.parametrize("datafidelitys", ["KL", "SWLS"])
+def test_FISTA_OS_unsupported_fidelity_cp_3D(
+    data_cupy, angles, ensure_clean_memory, datafidelitys
+):
+    detX = cp.shape(data_cupy)[2]
+    detY = cp.shape(data_cupy)[1]
+    N_size = detX
+    RecTools = RecToolsIRCuPy(
+        DetectorsDimH=detX,  # Horizontal detector dimension
+        DetectorsDimV=detY,  # Vertical detector dimension (3D case)
+        CenterRotOffset=0.0,  # Center of Rotation scalar or a vector
+        AnglesVec=angles,  # A vector of projection angles in radians
+        ObjSize=N_size,  # Reconstructed object dimensions (scalar)
+        datafidelity=datafidelitys,
+        device_projector=0,  # define the device
+    )
+    # data dictionary
+    _data_ = {
+        "projection_norm_data": data_cupy,
+        "projection_raw_data": data_cupy,
+        "OS_number": 5,
+        "data_axes_labels_order": ["angles", "detY", "detX"],
+    }
+    _algorithm_ = {"iterations": 1, "lipschitz_const": 5510.867}
+    with pytest.raises(ValueError):
+        RecTools.FISTA(_data_, _algorithm_)
+
+
 def test_FISTA_OS_reg_cp_3D(data_cupy, angles, ensure_clean_memory):
     detX = cp.shape(data_cupy)[2]
     detY = cp.shape(data_cupy)[1]
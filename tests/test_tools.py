@@ -2,7 +2,8 @@ import pytest
 
 import numpy as np
 from tomobar.supp.suppTools import normaliser
-from tomobar.supp.funcs import _swap_data_axes_to_accepted
+from tomobar.supp.funcs import _swap_data_axes_to_accepted, _data_dims_swapper
+from tomobar.regularisers import _parallel_tv_prox
 from numpy.testing import assert_allclose
 
 
@@ -57,3 +58,24 @@ def test_swap_data_axis_to_accepted4(labels, result):
     swap_list = _swap_data_axes_to_accepted(labels, labels_order)
     assert swap_list[0] == result[0]
     assert swap_list[1] == result[1]
+
+
+@pytest.mark.parametrize("labels", [["angles", "detX", "detY"]])
+def test_data_dims_swapper_two_swaps(labels):
+    labels_order = ["detY", "angles", "detX"]
+    data = np.arange(2 * 3 * 4, dtype=np.float32).reshape(2, 3, 4)
+    swapped = _data_dims_swapper(data, labels, labels_order)
+    assert swapped.shape == (4, 2, 3)
+    assert swapped.flags.c_contiguous
+    assert_allclose(swapped, np.transpose(data, (2, 0, 1)))
+
+
+def test_parallel_tv_prox():
+    rng = np.random.default_rng(0)
+    X = rng.random((5, 6, 7)).astype(np.float32)
+    assert_allclose(_parallel_tv_prox(X, 0.0), X, rtol=1e-06, atol=1e-06)
+    const = np.full((8, 8), 3.0, dtype=np.float32)
+    assert_allclose(_parallel_tv_prox(const, 0.5), const)
+    X_prox = _parallel_tv_prox(X, 0.1)
+    assert X_prox.dtype == np.float32
+    assert np.abs(np.diff(X_prox, axis=0)).sum() < np.abs(np.diff(X, axis=0)).sum()
@@ -29,6 +29,45 @@ except ImportError:
     print("____! Astra-toolbox package is missing, please install !____")
 
 
+def _to_device(data: Union[np.ndarray, xp.ndarray]) -> xp.ndarray:
+    """Uploads a host (e.g. pinned) NumPy array with a single set() into a device array,
+    cupy.asarray would stage it through an extra pinned-memory allocation. Arrays
+    exposing __cuda_array_interface__ (e.g. mapped host memory on unified-memory
+    devices) are wrapped without a copy."""
+    if xp is np or isinstance(data, xp.ndarray):
+        return data
+    if hasattr(data, "__cuda_array_interface__"):
+        return xp.asarray(data)
+    if not isinstance(data, np.ndarray):
+        return data
+    data_device = xp.empty(data.shape, dtype=xp.float32)
+    data_device.set(np.ascontiguousarray(data, dtype=np.float32))
+    return data_device
+
+
+def _gpu_link_compatible(data: xp.ndarray) -> xp.ndarray:
+    """ASTRA's GPULink assumes a C-contiguous float32 array, the array is copied
+    only if it is not the case (e.g. a view after swapaxes)."""
+    if data.dtype == xp.float32 and data.flags.c_contiguous:
+        return data
+    return xp.ascontiguousarray(data, dtype=xp.float32)
+
+
+def _zeroed_output(out: Union[np.ndarray, None], shape: tuple) -> np.ndarray:
+    """Returns a zero-initialised host array for ASTRA to write the result into,
+    reusing the preallocated `out` array if it is given."""
+    if out is None:
+        return np.zeros(shape, dtype=np.float32)
+    if (
+        not isinstance(out, np.ndarray)
+        or out.dtype != np.float32
+        or not out.flags.c_contiguous
+    ):
+        raise ValueError("The output array must be C-contiguous float32")
+    out.fill(0.0)
+    return out
+
+
 ###########Base class############
 class AstraBase:
     """The base class for projection/backprojection operations and various reconstruction algorithms using ASTRA toolbox wrappers.
@@ -63,6 +102,23 @@ class AstraBase:
         self.device_index = device_index
         self.ordsub_number = ordsub_number
         self.detectors_y = detectors_y
+        self._cfg_templates = {}  # ASTRA configurations per method, see _astra_cfg
+        self._vectors = None  # the vector geometry for all angles, see _geom_vectors
+
+    def __del__(self):
+        """Releases the ASTRA projectors which are kept alive for the lifetime of the object"""
+        try:
+            if self.detectors_y is None:
+                astra_projector = astra.projector
+            else:
+                astra_projector = astra.projector3d
+            if hasattr(self, "proj_id"):
+                astra_projector.delete(self.proj_id)
+            if hasattr(self, "proj_id_OS"):
+                astra_projector.delete(self.proj_id_OS)
+        except (NameError, AttributeError, TypeError):
+            # ASTRA is missing or already unloaded at the interpreter shutdown
+            pass
 
     @property
     def detectors_x(self) -> int:
@@ -174,19 +230,42 @@ class AstraBase:
 
     def _setOS_indices(self):
         angles_tot = np.size(self.angles_vec)  # total number of angles
+        if self.ordsub_number > angles_tot:
+            raise ValueError(
+                "The number of ordered subsets cannot exceed the number of angles"
+            )
         self.NumbProjBins = (int)(
             np.ceil(float(angles_tot) / float(self.ordsub_number))
         )  # get the number of projections per bin (subset)
-        self.newInd_Vec = np.zeros(
-            [self.ordsub_number, self.NumbProjBins], dtype="int"
-        )  # 2D array of OS-sorted indeces
-        for sub_ind in range(self.ordsub_number):
-            ind_sel = 0
-            for proj_ind in range(self.NumbProjBins):
-                indexS = ind_sel + sub_ind
-                if indexS < angles_tot:
-                    self.newInd_Vec[sub_ind, proj_ind] = indexS
-                    ind_sel += self.ordsub_number
+        # 2D array of OS-sorted indeces, every subset takes each ordsub_number-th angle
+        self.newInd_Vec = np.ascontiguousarray(
+            np.arange(self.ordsub_number * self.NumbProjBins, dtype="int")
+            .reshape(self.NumbProjBins, self.ordsub_number)
+            .T
+        )
+        # the list of indices for every subset, the shorter subsets are not padded
+        self.indVec_OS = [
+            ind_vec[ind_vec < angles_tot].copy() for ind_vec in self.newInd_Vec
+        ]
+        self.newInd_Vec[self.newInd_Vec >= angles_tot] = 0  # pad the shorter subsets
+
+    def _geom_vectors(self) -> np.ndarray:
+        """Returns the vector geometry for all angles. It is computed once and shared
+        by the full and the ordered-subsets projection geometries.
+
+        Returns:
+            np.ndarray: 2D or 3D vector geometry array.
+        """
+        if self._vectors is None:
+            if self.detectors_y is None:
+                self._vectors = _vec_geom_init2D(
+                    self.angles_vec, self.centre_of_rotation
+                )
+            else:
+                self._vectors = _vec_geom_init3D(
+                    self.angles_vec, 1.0, 1.0, self.centre_of_rotation
+                )
+        return self._vectors
 
     def _set_vol2d_geometry(self):
         """set the reconstruction (vol_geom)"""
@@ -200,6 +279,7 @@ class AstraBase:
             Y = X = self.recon_size
             Z = self.detectors_y
         self.vol_geom = astra.create_vol_geom(Y, X, Z)
+        self.vol_size = astra.geom_size(self.vol_geom)  # cached for the CuPy runners
 
     def _set_cpu_projection2d_parallel_geometry(self):
         """the classical 2D projection geometry (cpu)"""
@@ -212,7 +292,7 @@ class AstraBase:
 
     def _set_gpu_projection2d_parallel_geometry(self):
         """the classical projection geometry (gpu)"""
-        vectors = _vec_geom_init2D(self.angles_vec, self.centre_of_rotation)
+        vectors = self._geom_vectors()
         self.proj_geom = astra.create_proj_geom(
             "parallel_vec", self.detectors_x, vectors
         )
@@ -224,10 +304,11 @@ class AstraBase:
 
     def _set_gpu_projection3d_parallel_geometry(self):
         """the classical 3D projection geometry (cpu)"""
-        vectors = _vec_geom_init3D(self.angles_vec, 1.0, 1.0, self.centre_of_rotation)
+        vectors = self._geom_vectors()
         self.proj_geom = astra.create_proj_geom(
             "parallel3d_vec", self.detectors_y, self.detectors_x, vectors
         )
+        self.proj_size = astra.geom_size(self.proj_geom)
         # optomo operator is used for ADMM algorithm only
         self.proj_id = astra.create_projector(
             "cuda3d", self.proj_geom, self.vol_geom
@@ -236,22 +317,12 @@ class AstraBase:
 
     def _set_projection2d_OS_parallel_geometry(self):
         """organising 2d OS projection geometry CPU/GPU"""
-        self.proj_geom_OS = {}
-        self.proj_id_OS = {}
+        self.proj_geom_OS = [None] * self.ordsub_number
+        self.proj_id_OS = [None] * self.ordsub_number
+        # the vectors for all angles are computed once and then selected per subset
+        vectors = self._geom_vectors()
         for sub_ind in range(self.ordsub_number):
-            self.indVec = self.newInd_Vec[sub_ind, :]  # OS-specific indices
-            if self.indVec[self.NumbProjBins - 1] == 0:
-                self.indVec = self.indVec[:-1]  # shrink vector size
-            anglesOS = self.angles_vec[self.indVec]  # OS-specific angles
-
-            if np.ndim(self.centre_of_rotation) == 0:
-                # centre_of_rotation is a _scalar_
-                vectorsOS = _vec_geom_init2D(anglesOS, self.centre_of_rotation)
-            else:
-                # centre_of_rotation is a _vector_
-                vectorsOS = _vec_geom_init2D(
-                    anglesOS, self.centre_of_rotation[self.indVec]
-                )
+            vectorsOS = vectors[self.indVec_OS[sub_ind]]  # OS-specific vectors
             self.proj_geom_OS[sub_ind] = astra.create_proj_geom(
                 "parallel_vec", self.detectors_x, vectorsOS
             )
@@ -266,30 +337,66 @@ class AstraBase:
 
     def _set_projection3d_OS_parallel_geometry(self):
         """organising 3d OS projection geometry CPU/GPU"""
-        self.proj_geom_OS = {}
+        self.proj_geom_OS = [None] * self.ordsub_number
+        self.proj_id_OS = [None] * self.ordsub_number
+        self.proj_size_OS = [None] * self.ordsub_number
+        # the vectors for all angles are computed once and then selected per subset
+        vectors = self._geom_vectors()
         for sub_ind in range(self.ordsub_number):
-            self.indVec = self.newInd_Vec[sub_ind, :]
-            if self.indVec[self.NumbProjBins - 1] == 0:
-                self.indVec = self.indVec[:-1]  # shrink vector size
-            anglesOS = self.angles_vec[self.indVec]  # OS-specific angles
-
-            if np.ndim(self.centre_of_rotation) == 0:  # CenterRotOffset is a _scalar_
-                vectors = _vec_geom_init3D(anglesOS, 1.0, 1.0, self.centre_of_rotation)
-            else:  # CenterRotOffset is a _vector_
-                vectors = _vec_geom_init3D(
-                    anglesOS, 1.0, 1.0, self.centre_of_rotation[self.indVec]
-                )
+            vectorsOS = vectors[self.indVec_OS[sub_ind]]  # OS-specific vectors
             self.proj_geom_OS[sub_ind] = astra.create_proj_geom(
-                "parallel3d_vec", self.detectors_y, self.detectors_x, vectors
+                "parallel3d_vec", self.detectors_y, self.detectors_x, vectorsOS
+            )
+            self.proj_size_OS[sub_ind] = astra.geom_size(self.proj_geom_OS[sub_ind])
+            self.proj_id_OS[sub_ind] = astra.create_projector(
+                "cuda3d", self.proj_geom_OS[sub_ind], self.vol_geom
             )
         return self.proj_geom_OS
 
+    def _astra_cfg(self, method: str) -> dict:
+        """Returns the ASTRA configuration dictionary for the method. The template is
+        built once and a copy of it is returned, so the data (and projector) ids set by
+        the caller never leak into the runs of other geometries.
+
+        Args:
+            method (str): A method to choose from ASTRA's provided ones.
+
+        Returns:
+            dict: ASTRA configuration dictionary.
+        """
+        cfg = self._cfg_templates.get(method)
+        if cfg is None:
+            cfg = astra.astra_dict(method)
+            if self.processing_arch == "gpu":
+                cfg["option"] = {"GPUindex": self.device_index}
+            if method == "FBP" or method == "FBP_CUDA":
+                cfg["FilterType"] = "Ram-Lak"
+            self._cfg_templates[method] = cfg
+        return dict(cfg)
+
+    def _projection_geometry(self, os_index: Union[int, None]) -> tuple:
+        """Selects the projection geometry and its projector for the subset given by
+        os_index or, when os_index is None, for the full set of angles.
+
+        Args:
+            os_index (Union[int, None]): The number of ordered subsets.
+
+        Returns:
+            tuple: ASTRA projection geometry and the projector id.
+        """
+        if self.ordsub_number != 1 and os_index is not None:
+            # ordered-subsets
+            return self.proj_geom_OS[os_index], self.proj_id_OS[os_index]
+        # traditional full data parallel beam projection geometry
+        return self.proj_geom, self.proj_id
+
     def _runAstraBackproj2D(
         self,
         sinogram: np.ndarray,
         method: str,
         iterations: int,
         os_index: Union[int, None],
+        out: Union[np.ndarray, None] = None,
     ) -> np.ndarray:
         """2D ASTRA-based back-projector
 
@@ -298,54 +405,46 @@ class AstraBase:
             method (str): A method to choose from the ASTRA's provided ones.
             iterations (int): The number of iterations for iterative methods.
             os_index (Union[int, None]): The number of ordered subsets.
+            out (np.ndarray, optional): A preallocated C-contiguous float32 array of
+                the image size to store the result in.
 
         Returns:
             np.ndarray: The reconstructed 2D image.
         """
-        if self.ordsub_number != 1 and os_index is not None:
-            # ordered-subsets
-            sinogram_id = astra.data2d.create(
-                "-sino", self.proj_geom_OS[os_index], sinogram
-            )
-        else:
-            # traditional geometry
-            sinogram_id = astra.data2d.create("-sino", self.proj_geom, sinogram)
-
-        # Create a data object for the reconstruction
-        rec_id = astra.data2d.create("-vol", self.vol_geom)
+        if iterations == 0:
+            # skip ASTRA for zero work, iterative methods are initialised with zeros
+            return _zeroed_output(out, astra.geom_size(self.vol_geom))
+        # link the sinogram to ASTRA instead of copying it (copied only if not float32)
+        sinogram = np.ascontiguousarray(sinogram, dtype=np.float32)
+        proj_geom, projector_id = self._projection_geometry(os_index)
+        sinogram_id = astra.data2d.link("-sino", proj_geom, sinogram)
+
+        # link a zero-initialised output array, ASTRA writes the result into it
+        recon_slice = _zeroed_output(out, astra.geom_size(self.vol_geom))
+        rec_id = astra.data2d.link("-vol", self.vol_geom, recon_slice)
 
         # Create algorithm object
-        cfg = astra.astra_dict(method)
+        cfg = self._astra_cfg(method)
         if self.processing_arch == "cpu":
-            if self.ordsub_number != 1:
-                cfg["ProjectorId"] = self.proj_id_OS[os_index]
-            else:
-                cfg["ProjectorId"] = self.proj_id
-        else:
-            cfg["option"] = {"GPUindex": self.device_index}
+            cfg["ProjectorId"] = projector_id
         cfg["ReconstructionDataId"] = rec_id
         cfg["ProjectionDataId"] = sinogram_id
-        if method == "FBP" or method == "FBP_CUDA":
-            cfg["FilterType"] = "Ram-Lak"
 
         # Create the algorithm object from the configuration structure
         alg_id = astra.algorithm.create(cfg)
         astra.algorithm.run(alg_id, iterations)
 
-        # Get the result
-        recon_slice = astra.data2d.get(rec_id)
-
         astra.algorithm.delete(alg_id)
         astra.data2d.delete(rec_id)
         astra.data2d.delete(sinogram_id)
-        if self.ordsub_number != 1:
-            astra.data2d.delete(self.proj_id_OS)
-        else:
-            astra.data2d.delete(self.proj_id)
         return recon_slice
 
     def _runAstraProj2D(
-        self, image: np.ndarray, os_index: Union[int, None], method: str
+        self,
+        image: np.ndarray,
+        os_index: Union[int, None],
+        method: str,
+        out: Union[np.ndarray, None] = None,
     ) -> np.ndarray:
         """2D Forward projector for ASTRA parallel-beam
 
@@ -353,30 +452,27 @@ class AstraBase:
             image (np.ndarray): Object to perform forward projection on.
             os_index (Union[int, None]): The number of ordered subsets.
             method (str): A method to choose from ASTRA's provided ones.
+            out (np.ndarray, optional): A preallocated C-contiguous float32 array of
+                the sinogram size to store the result in.
 
         Returns:
             np.ndarray: projected 2d data (sinogram)
         """
         if isinstance(image, np.ndarray):
+            # link the image to ASTRA instead of copying it (copied only if not float32)
+            image = np.ascontiguousarray(image, dtype=np.float32)
             rec_id = astra.data2d.link("-vol", self.vol_geom, image)
         else:
             rec_id = image
-        if self.ordsub_number != 1 and os_index is not None:
-            # ordered-subsets
-            sinogram_id = astra.data2d.create("-sino", self.proj_geom_OS[os_index], 0)
-        else:
-            # traditional full data parallel beam projection geometry
-            sinogram_id = astra.data2d.create("-sino", self.proj_geom, 0)
+        proj_geom, projector_id = self._projection_geometry(os_index)
+        # link a zero-initialised output array, ASTRA writes the result into it
+        sinogram = _zeroed_output(out, astra.geom_size(proj_geom))
+        sinogram_id = astra.data2d.link("-sino", proj_geom, sinogram)
 
         # Create algorithm object
-        cfg = astra.astra_dict(method)
+        cfg = self._astra_cfg(method)
         if self.processing_arch == "cpu":
-            if self.ordsub_number != 1:
-                cfg["ProjectorId"] = self.proj_id_OS[os_index]
-            else:
-                cfg["ProjectorId"] = self.proj_id
-        else:
-            cfg["option"] = {"GPUindex": self.device_index}
+            cfg["ProjectorId"] = projector_id
         cfg["VolumeDataId"] = rec_id
         cfg["ProjectionDataId"] = sinogram_id
 
@@ -384,15 +480,8 @@ class AstraBase:
         alg_id = astra.algorithm.create(cfg)
         astra.algorithm.run(alg_id)
 
-        # Get the result
-        sinogram = astra.data2d.get(sinogram_id)
-
         astra.algorithm.delete(alg_id)
         astra.data2d.delete(rec_id)
-        if self.ordsub_number != 1:
-            astra.data2d.delete(self.proj_id_OS)
-        else:
-            astra.data2d.delete(self.proj_id)
         astra.data2d.delete(sinogram_id)
         return sinogram
 
@@ -402,6 +491,7 @@ class AstraBase:
         method: str,
         iterations: int,
         os_index: Union[int, None],
+        out: Union[np.ndarray, None] = None,
     ) -> np.ndarray:
         """ "3D ASTRA-based back-projector for parallel beam
 
@@ -410,26 +500,32 @@ class AstraBase:
             method (str): A method to choose from ASTRA's provided ones.
             iterations (int): The number of iterations for iterative methods.
             os_index (Union[int, None]): The number of ordered subsets.
+            out (np.ndarray, optional): A preallocated C-contiguous float32 array of
+                the volume size to store the result in.
 
         Returns:
             np.ndarray: The reconstructed 3D volume.
         """
-        # set ASTRA configuration for 3D reconstructor
-        if self.ordsub_number != 1 and os_index is not None:
-            # ordered-subsets
-            proj_id = astra.data3d.create(
-                "-sino", self.proj_geom_OS[os_index], proj_data
+        if xp is not np and isinstance(proj_data, xp.ndarray):
+            # the data is already on the device, link it without host transfers
+            return self.runAstraBackproj3DCuPy(
+                proj_data, method, os_index, out=out, iterations=iterations
             )
-        else:
-            # traditional full data parallel beam projection geometry
-            proj_id = astra.data3d.create("-sino", self.proj_geom, proj_data)
+        if iterations == 0:
+            # skip ASTRA for zero work, iterative methods are initialised with zeros
+            return _zeroed_output(out, astra.geom_size(self.vol_geom))
+        # set ASTRA configuration for 3D reconstructor
+        # link the data to ASTRA instead of copying it (copied only if not float32)
+        proj_data = np.ascontiguousarray(proj_data, dtype=np.float32)
+        proj_geom, _ = self._projection_geometry(os_index)
+        proj_id = astra.data3d.link("-sino", proj_geom, proj_data)
 
-        # Create a data object for the reconstruction
-        rec_id = astra.data3d.create("-vol", self.vol_geom)
+        # link a zero-initialised output array, ASTRA writes the result into it
+        recon_volume = _zeroed_output(out, astra.geom_size(self.vol_geom))
+        rec_id = astra.data3d.link("-vol", self.vol_geom, recon_volume)
 
         # Create algorithm object
-        cfg = astra.astra_dict(method)
-        cfg["option"] = {"GPUindex": self.device_index}
+        cfg = self._astra_cfg(method)
         cfg["ReconstructionDataId"] = rec_id
         cfg["ProjectionDataId"] = proj_id
 
@@ -437,42 +533,45 @@ class AstraBase:
         alg_id = astra.algorithm.create(cfg)
         astra.algorithm.run(alg_id, iterations)
 
-        # Get the result
-        recon_volume = astra.data3d.get(rec_id)
-
         astra.algorithm.delete(alg_id)
         astra.data3d.delete(rec_id)
         astra.data3d.delete(proj_id)
         return recon_volume
 
     def runAstraProj3D(
-        self, volume_data: np.ndarray, os_index: Union[int, None]
+        self,
+        volume_data: np.ndarray,
+        os_index: Union[int, None],
+        out: Union[np.ndarray, None] = None,
     ) -> np.ndarray:
         """3D ASTRA-based projector for parallel beam
 
         Args:
             volume_data (np.ndarray): 3D object to project
             os_index (Union[int, None]): The number of ordered subsets.
+            out (np.ndarray, optional): A preallocated C-contiguous float32 array of
+                the projection data size to store the result in.
 
         Returns:
             np.ndarray: 3D projection data
         """
+        if xp is not np and isinstance(volume_data, xp.ndarray):
+            # the data is already on the device, link it without host transfers
+            return self.runAstraProj3DCuPy(volume_data, os_index, out)
         # set ASTRA configuration for 3D projector
         if isinstance(volume_data, np.ndarray):
+            # link the volume instead of copying it (copied only if not float32)
+            volume_data = np.ascontiguousarray(volume_data, dtype=np.float32)
             volume_id = astra.data3d.link("-vol", self.vol_geom, volume_data)
         else:
             volume_id = volume_data
-        if self.ordsub_number != 1 and os_index is not None:
-            # ordered-subsets
-            proj_id = astra.data3d.create("-sino", self.proj_geom_OS[os_index], 0)
-        else:
-            # traditional full data parallel beam projection geometry
-            proj_id = astra.data3d.create("-sino", self.proj_geom, 0)
+        proj_geom, _ = self._projection_geometry(os_index)
+        # link a zero-initialised output array, ASTRA writes the result into it
+        proj_volume = _zeroed_output(out, astra.geom_size(proj_geom))
+        proj_id = astra.data3d.link("-sino", proj_geom, proj_volume)
 
         # Create algorithm object
-        algString = "FP3D_CUDA"
-        cfg = astra.astra_dict(algString)
-        cfg["option"] = {"GPUindex": self.device_index}
+        cfg = self._astra_cfg("FP3D_CUDA")
         cfg["VolumeDataId"] = volume_id
         cfg["ProjectionDataId"] = proj_id
 
@@ -480,111 +579,125 @@ class AstraBase:
         alg_id = astra.algorithm.create(cfg)
         astra.algorithm.run(alg_id)
 
-        # Get the result
-        proj_volume = astra.data3d.get(proj_id)
-
         astra.algorithm.delete(alg_id)
         astra.data3d.delete(volume_id)
         astra.data3d.delete(proj_id)
         return proj_volume
 
     def runAstraBackproj3DCuPy(
-        self, proj_data: xp.ndarray, method: str, os_index: Union[int, None]
+        self,
+        proj_data: xp.ndarray,
+        method: str,
+        os_index: Union[int, None],
+        out: Union[xp.ndarray, None] = None,
+        iterations: int = 1,
     ) -> xp.ndarray:
         """3d back-projection using ASTRA's GPULink functionality for CuPy arrays
 
         Args:
-            proj_data (xp.ndarray): 3d projection data as a CuPy array
-            method (str): Only BP is available so far.
+            proj_data (xp.ndarray): 3d float32 or float16 projection data as a CuPy array
+                (a NumPy array is uploaded to the device).
+            method (str): A 3D CUDA method of ASTRA, e.g. BP3D_CUDA or SIRT3D_CUDA.
             os_index (Union[int, None]): The number of ordered subsets.
+            out (xp.ndarray, optional): A preallocated C-contiguous float32 CuPy
+                array of the volume size to store the result in.
+            iterations (int, optional): The number of iterations for iterative methods.
 
         Returns:
-            xp.ndarray: A CuPy array containing back-projected volume.
+            xp.ndarray: A CuPy array containing back-projected volume. It is float16 if
+                the projection data is float16 and `out` is not given.
         """
+        # ASTRA works in single precision, half-precision data is cast on entry/exit
+        half_precision = proj_data.dtype == xp.float16
+        proj_data = _gpu_link_compatible(_to_device(proj_data))
         # set ASTRA configuration for 3D reconstructor using CuPy arrays
         proj_link = astra.data3d.GPULink(
             proj_data.data.ptr, *proj_data.shape[::-1], 4 * proj_data.shape[2]
         )
-        if self.ordsub_number != 1 and os_index is not None:
-            # ordered-subsets
-            projector_id = astra.create_projector(
-                "cuda3d", self.proj_geom_OS[os_index], self.vol_geom
-            )
-            proj_id = astra.data3d.link(
-                "-proj3d", self.proj_geom_OS[os_index], proj_link
-            )
-        else:
-            # traditional full data parallel beam projection geometry
-            projector_id = astra.create_projector(
-                "cuda3d", self.proj_geom, self.vol_geom
-            )
-            proj_id = astra.data3d.link("-proj3d", self.proj_geom, proj_link)
+        proj_geom, projector_id = self._projection_geometry(os_index)
+        proj_id = astra.data3d.link("-proj3d", proj_geom, proj_link)
 
-        # create a CuPy array with ASTRA link to it
-        recon_volume = xp.zeros(astra.geom_size(self.vol_geom), dtype=np.float32)
+        # create (or reuse) a CuPy array with ASTRA link to it
+        if out is None:
+            recon_volume = xp.zeros(self.vol_size, dtype=np.float32)
+        else:
+            if out.dtype != xp.float32 or not out.flags.c_contiguous:
+                raise ValueError("The output array must be C-contiguous float32")
+            recon_volume = out
+            recon_volume.fill(0.0)
         rec_link = astra.data3d.GPULink(
             recon_volume.data.ptr, *recon_volume.shape[::-1], 4 * recon_volume.shape[2]
         )
         rec_id = astra.data3d.link("-vol", self.vol_geom, rec_link)
 
         # Create algorithm object
-        cfg = astra.astra_dict(method)
-        cfg["option"] = {"GPUindex": self.device_index}
+        cfg = self._astra_cfg(method)
         cfg["ProjectionDataId"] = proj_id
         cfg["ReconstructionDataId"] = rec_id
         cfg["ProjectorId"] = projector_id
 
         # Create the algorithm object from the configuration structure
         alg_id = astra.algorithm.create(cfg)
-        astra.algorithm.run(alg_id, 1)
+        astra.algorithm.run(alg_id, iterations)
 
         astra.algorithm.delete(alg_id)
         astra.data3d.delete(rec_id)
         astra.data3d.delete(proj_id)
+        if half_precision and out is None:
+            return recon_volume.astype(xp.float16)
         return recon_volume
 
     def runAstraProj3DCuPy(
-        self, volume_data: xp.ndarray, os_index: Union[int, None]
+        self,
+        volume_data: xp.ndarray,
+        os_index: Union[int, None],
+        out: Union[xp.ndarray, None] = None,
     ) -> xp.ndarray:
         """3d forward projector using ASTRA's GPULink functionality for CuPy arrays
 
         Args:
-            volume_data (xp.ndarray): the input 3d volume as a CuPy array
+            volume_data (xp.ndarray): the input 3d float32 or float16 CuPy volume
+                (a NumPy array is uploaded to the device).
             os_index (Union[int, None]): The number of ordered subsets.
+            out (xp.ndarray, optional): A preallocated C-contiguous float32 CuPy
+                array of the projection data size to store the result in.
 
         Returns:
-            xp.ndarray: projected volume array as a cupy array
+            xp.ndarray: projected volume array as a cupy array. It is float16 if the
+                volume is float16 and `out` is not given.
         """
+        # ASTRA works in single precision, half-precision data is cast on entry/exit
+        half_precision = volume_data.dtype == xp.float16
+        volume_data = _gpu_link_compatible(_to_device(volume_data))
         # Enable GPUlink to the volume
         volume_link = astra.data3d.GPULink(
             volume_data.data.ptr, *volume_data.shape[::-1], 4 * volume_data.shape[2]
         )
         volume_id = astra.data3d.link("-vol", self.vol_geom, volume_link)
 
-        if self.ordsub_number != 1:
+        if self.ordsub_number != 1 and os_index is not None:
             # ordered-subsets approach
-            proj_volume = xp.zeros(
-                astra.geom_size(self.proj_geom_OS[os_index]), dtype=xp.float32
-            )
-            gpu_link_sino = astra.data3d.GPULink(
-                proj_volume.data.ptr, *proj_volume.shape[::-1], 4 * proj_volume.shape[2]
-            )
-            proj_id = astra.data3d.link(
-                "-sino", self.proj_geom_OS[os_index], gpu_link_sino
-            )
+            proj_geom = self.proj_geom_OS[os_index]
+            proj_size = self.proj_size_OS[os_index]
         else:
             # traditional full data parallel beam projection geometry
-            # Enabling GPUlink to the created empty CuPy array
-            proj_volume = xp.zeros(astra.geom_size(self.proj_geom), dtype=xp.float32)
-            gpu_link_sino = astra.data3d.GPULink(
-                proj_volume.data.ptr, *proj_volume.shape[::-1], 4 * proj_volume.shape[2]
-            )
-            proj_id = astra.data3d.link("-sino", self.proj_geom, gpu_link_sino)
+            proj_geom = self.proj_geom
+            proj_size = self.proj_size
+        # Enabling GPUlink to the created (or reused) empty CuPy array
+        if out is None:
+            proj_volume = xp.zeros(proj_size, dtype=xp.float32)
+        else:
+            if out.dtype != xp.float32 or not out.flags.c_contiguous:
+                raise ValueError("The output array must be C-contiguous float32")
+            proj_volume = out
+            proj_volume.fill(0.0)
+        gpu_link_sino = astra.data3d.GPULink(
+            proj_volume.data.ptr, *proj_volume.shape[::-1], 4 * proj_volume.shape[2]
+        )
+        proj_id = astra.data3d.link("-sino", proj_geom, gpu_link_sino)
 
         # Create algorithm object
-        algString = "FP3D_CUDA"
-        cfg = astra.astra_dict(algString)
-        cfg["option"] = {"GPUindex": self.device_index}
+        cfg = self._astra_cfg("FP3D_CUDA")
         cfg["VolumeDataId"] = volume_id
         cfg["ProjectionDataId"] = proj_id
 
@@ -595,4 +708,6 @@ class AstraBase:
         astra.algorithm.delete(alg_id)
         astra.data3d.delete(volume_id)
         astra.data3d.delete(proj_id)
+        if half_precision and out is None:
+            return proj_volume.astype(xp.float16)
         return proj_volume
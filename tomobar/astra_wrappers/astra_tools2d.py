@@ -33,6 +33,14 @@ class AstraTools2D(AstraBase):
             detectors_y=None,
         )
 
+        # ASTRA methods for the chosen architecture are resolved once
+        suffix = "" if processing_arch == "cpu" else "_CUDA"
+        self._fp_method = "FP" + suffix
+        self._bp_method = "BP" + suffix
+        self._fbp_method = "FBP" + suffix
+        self._sirt_method = "SIRT" + suffix
+        self._cgls_method = "CGLS" + suffix
+
         if verbosity:
             print("The shape of the input data has been established...")
         super()._set_vol2d_geometry()
@@ -52,6 +60,11 @@ class AstraTools2D(AstraBase):
         else:
             super()._setOS_indices()
             super()._set_projection2d_OS_parallel_geometry()
+            # the full geometry is also kept to project all angles in one call
+            if processing_arch == "cpu":
+                super()._set_cpu_projection2d_parallel_geometry()
+            else:
+                super()._set_gpu_projection2d_parallel_geometry()
             if verbosity:
                 print(
                     "2D <{}> ordered-subsets parallel-beam projection geometry initialised...".format(
@@ -59,44 +72,33 @@ class AstraTools2D(AstraBase):
                     )
                 )
 
-    def _forwproj(self, image: np.ndarray) -> np.ndarray:
-        astra_method = "FP_CUDA"  # 2d forward projection
-        if self.processing_arch == "cpu":
-            astra_method = "FP"
-        return super()._runAstraProj2D(image, None, astra_method)
+    def _forwproj(self, image: np.ndarray, out=None) -> np.ndarray:
+        return super()._runAstraProj2D(
+            image, None, self._fp_method, out
+        )  # 2d forward projection
 
-    def _forwprojOS(self, image: np.ndarray, os_index: int) -> np.ndarray:
-        astra_method = "FP_CUDA"  # 2d forward projection
-        if self.processing_arch == "cpu":
-            astra_method = "FP"
-        return super()._runAstraProj2D(image, os_index, astra_method)
+    def _forwprojOS(self, image: np.ndarray, os_index: int, out=None) -> np.ndarray:
+        return super()._runAstraProj2D(image, os_index, self._fp_method, out)
 
-    def _backproj(self, sinogram: np.ndarray) -> np.ndarray:
-        astra_method = "BP_CUDA"  # 2D back projection
-        if self.processing_arch == "cpu":
-            astra_method = "BP"
-        return super()._runAstraBackproj2D(sinogram, astra_method, 1, None)
+    def _backproj(self, sinogram: np.ndarray, out=None) -> np.ndarray:
+        return super()._runAstraBackproj2D(
+            sinogram, self._bp_method, 1, None, out
+        )  # 2D back projection
 
-    def _backprojOS(self, sinogram: np.ndarray, os_index: int) -> np.ndarray:
-        astra_method = "BP_CUDA"  # 2D back projection
-        if self.processing_arch == "cpu":
-            astra_method = "BP"
-        return super()._runAstraBackproj2D(sinogram, astra_method, 1, os_index)
+    def _backprojOS(self, sinogram: np.ndarray, os_index: int, out=None) -> np.ndarray:
+        return super()._runAstraBackproj2D(sinogram, self._bp_method, 1, os_index, out)
 
     def _fbp(self, sinogram: np.ndarray) -> np.ndarray:
-        astra_method = "FBP_CUDA"  # 2D FBP reconstruction
-        if self.processing_arch == "cpu":
-            astra_method = "FBP"
-        return super()._runAstraBackproj2D(sinogram, astra_method, 1, None)
+        return super()._runAstraBackproj2D(
+            sinogram, self._fbp_method, 1, None
+        )  # 2D FBP reconstruction
 
     def _sirt(self, sinogram: np.ndarray, iterations: int) -> np.ndarray:
-        astra_method = "SIRT_CUDA"  # perform 2D SIRT reconstruction
-        if self.processing_arch == "cpu":
-            astra_method = "SIRT"
-        return super()._runAstraBackproj2D(sinogram, astra_method, iterations, None)
+        return super()._runAstraBackproj2D(
+            sinogram, self._sirt_method, iterations, None
+        )  # perform 2D SIRT reconstruction
 
     def _cgls(self, sinogram: np.ndarray, iterations: int) -> np.ndarray:
-        astra_method = "CGLS_CUDA"  # perform 2D CGLS reconstruction
-        if self.processing_arch == "cpu":
-            astra_method = "CGLS"
-        return super()._runAstraBackproj2D(sinogram, astra_method, iterations, None)
+        return super()._runAstraBackproj2D(
+            sinogram, self._cgls_method, iterations, None
+        )  # perform 2D CGLS reconstruction
@@ -64,6 +64,9 @@ class AstraTools3D(AstraBase):
         else:
             super()._setOS_indices()
             super()._set_projection3d_OS_parallel_geometry()
+            # the full geometry is also kept to project all angles in one call
+            if processing_arch == "gpu":
+                super()._set_gpu_projection3d_parallel_geometry()
             if verbosity:
                 print(
                     "3D <{}> ordered-subsets parallel-beam projection geometry initialised...".format(
@@ -71,40 +74,44 @@ class AstraTools3D(AstraBase):
                     )
                 )
 
-    def _forwproj(self, object3D: np.ndarray) -> np.ndarray:
-        return super().runAstraProj3D(object3D, None)
+    def _forwproj(self, object3D: np.ndarray, out=None) -> np.ndarray:
+        return super().runAstraProj3D(object3D, None, out)
 
-    def _forwprojOS(self, object3D: np.ndarray, os_index: int) -> np.ndarray:
-        return super().runAstraProj3D(object3D, os_index)
+    def _forwprojOS(self, object3D: np.ndarray, os_index: int, out=None) -> np.ndarray:
+        return super().runAstraProj3D(object3D, os_index, out)
 
-    def _forwprojCuPy(self, object3D: xp.ndarray) -> xp.ndarray:
+    def _forwprojCuPy(self, object3D: xp.ndarray, out=None) -> xp.ndarray:
         return super().runAstraProj3DCuPy(
-            object3D, None
+            object3D, None, out
         )  # 3D forward projection using CuPy array
 
-    def _forwprojOSCuPy(self, object3D: xp.ndarray, os_index: int) -> xp.ndarray:
+    def _forwprojOSCuPy(
+        self, object3D: xp.ndarray, os_index: int, out=None
+    ) -> xp.ndarray:
         return super().runAstraProj3DCuPy(
-            object3D, os_index
+            object3D, os_index, out
         )  # 3D forward projection using CuPy array
 
-    def _backproj(self, proj_data: np.ndarray) -> np.ndarray:
+    def _backproj(self, proj_data: np.ndarray, out=None) -> np.ndarray:
         return super().runAstraBackproj3D(
-            proj_data, "BP3D_CUDA", 1, None
+            proj_data, "BP3D_CUDA", 1, None, out
         )  # 3D backprojection
 
-    def _backprojOS(self, proj_data: np.ndarray, os_index: int) -> np.ndarray:
+    def _backprojOS(self, proj_data: np.ndarray, os_index: int, out=None) -> np.ndarray:
         return super().runAstraBackproj3D(
-            proj_data, "BP3D_CUDA", 1, os_index
+            proj_data, "BP3D_CUDA", 1, os_index, out
         )  # 3D OS backprojection
 
-    def _backprojCuPy(self, proj_data: xp.ndarray) -> xp.ndarray:
+    def _backprojCuPy(self, proj_data: xp.ndarray, out=None) -> xp.ndarray:
         return super().runAstraBackproj3DCuPy(
-            proj_data, "BP3D_CUDA", None
+            proj_data, "BP3D_CUDA", None, out
         )  # 3D backprojection using CuPy array
 
-    def _backprojOSCuPy(self, proj_data: xp.ndarray, os_index: int) -> xp.ndarray:
+    def _backprojOSCuPy(
+        self, proj_data: xp.ndarray, os_index: int, out=None
+    ) -> xp.ndarray:
         return super().runAstraBackproj3DCuPy(
-            proj_data, "BP3D_CUDA", os_index
+            proj_data, "BP3D_CUDA", os_index, out
         )  # 3d back-projection using CuPy array for a specific subset
 
     def _sirt(self, proj_data: np.ndarray, iterations: int) -> np.ndarray:
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import List, Tuple
 
 try:
@@ -14,9 +15,18 @@ def load_cuda_module(
 ) -> cp.RawModule:
     """Load a CUDA module file, i.e. a .cu file, from the file system,
     compile it, and return is as a CuPy RawModule for further
-    processing.
+    processing. Modules are cached, so every file is read and compiled once
+    per process.
     """
+    if name_expressions is not None:
+        name_expressions = tuple(name_expressions)
+    return _load_cuda_module(file, name_expressions, tuple(options))
 
+
+@lru_cache(maxsize=None)
+def _load_cuda_module(
+    file: str, name_expressions: Tuple[str], options: Tuple[str]
+) -> cp.RawModule:
     dir = os.path.dirname(os.path.abspath(__file__))
     file = os.path.join(dir, file + ".cu")
     # insert a preprocessor line directive to assist compiler errors (so line numbers show correctly in output)
@@ -26,5 +36,7 @@ def load_cuda_module(
         code += f.read()
 
     return cp.RawModule(
-        options=("-std=c++11", *options), code=code, name_expressions=name_expressions
+        options=("-std=c++11", *options),
+        code=code,
+        name_expressions=None if name_expressions is None else list(name_expressions),
     )
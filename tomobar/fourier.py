@@ -28,7 +28,7 @@ def _filtersinc3D_cupy(projection3D: xp.ndarray, cutoff: float = 0.6) -> xp.ndar
 
     Args:
         data : xp.ndarray
-            Projection data as a CuPy array.
+            Projection data as a CuPy array in ["detY", "angles", "detX"] axes order.
         cutoff: float
             cutoff for sinc filter, lower values lead to sharper reconstructions
 
@@ -36,11 +36,7 @@ def _filtersinc3D_cupy(projection3D: xp.ndarray, cutoff: float = 0.6) -> xp.ndar
         xp.ndarray
             The filtered projectiond data as a CuPy array.
     """
-    (projectionsNum, DetectorsLengthV, DetectorsLengthH) = xp.shape(projection3D)
-
-    # prepearing a ramp-like filter to apply to every projection
-    module = load_cuda_module("generate_filtersync")
-    filter_prep = module.get_function("generate_filtersinc")
+    (DetectorsLengthV, projectionsNum, DetectorsLengthH) = xp.shape(projection3D)
 
     # prepearing a ramp-like filter to apply to every projection
     module = load_cuda_module("generate_filtersync")
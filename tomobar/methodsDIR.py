@@ -6,25 +6,46 @@
 """
 
 import numpy as np
-import scipy.fftpack
+import os
+import scipy.fft
+import scipy.interpolate
+import scipy.spatial
 
+from functools import lru_cache
 from typing import Union
 from tomobar.astra_wrappers.astra_tools2d import AstraTools2D
 from tomobar.astra_wrappers.astra_tools3d import AstraTools3D
 from tomobar.supp.funcs import _data_dims_swapper, _parse_device_argument
 
+_WORKERS = os.cpu_count()
 
-def _filtersinc3D(projection3D: np.ndarray):
-    """Applies a 3D filter to 3D projection data for FBP
+try:
+    import pyfftw
+
+    pyfftw.interfaces.cache.enable()
+    _FFT_BACKEND = pyfftw.interfaces.scipy_fft
+except ImportError:
+    # "____! pyFFTW is missing, the default scipy FFT backend is used !____"
+    _FFT_BACKEND = "scipy"
+
+
+@lru_cache(maxsize=8)
+def _sinc_filter(
+    DetectorsLengthH: int, projectionsNum: int, a: float = 1.1
+) -> np.ndarray:
+    """Builds the shifted sinc filter for FBP, scaled by the number of projections.
+
+    The filter only depends on the data dimensions, so it is cached between calls
+    and returned as a read-only array.
 
     Args:
-        projection3D (np.ndarray): projection data
+        DetectorsLengthH (int): Horizontal detector dimension.
+        projectionsNum (int): The number of projections.
+        a (float, optional): Filter parameter. Defaults to 1.1.
 
     Returns:
-        np.ndarray: Filtered data
+        np.ndarray: A 1D float32 filter of DetectorsLengthH size.
     """
-    a = 1.1
-    [DetectorsLengthV, projectionsNum, DetectorsLengthH] = np.shape(projection3D)
     w = np.linspace(
         -np.pi,
         np.pi - (2 * np.pi) / DetectorsLengthH,
@@ -34,50 +55,51 @@ def _filtersinc3D(projection3D: np.ndarray):
 
     rn1 = np.abs(2.0 / a * np.sin(a * w / 2.0))
     rn2 = np.sin(a * w / 2.0)
-    rd = (a * w) / 2.0
-    rd_c = np.zeros([1, DetectorsLengthH])
-    rd_c[0, :] = rd
-    r = rn1 * (np.dot(rn2, np.linalg.pinv(rd_c))) ** 2
+    rd = ((a * w) / 2.0).astype(np.float64)
+    # the pseudo-inverse of the row vector rd is rd.T / (rd . rd)
+    r = rn1 * (np.dot(rn2, rd) / np.dot(rd, rd)) ** 2
     multiplier = 1.0 / projectionsNum
-    f = scipy.fftpack.fftshift(r)
-    # making a 2d filter for projection
-    f_2d = np.zeros((DetectorsLengthV, DetectorsLengthH), dtype="float32")
-    f_2d[0::, :] = f
-    filtered = np.zeros(np.shape(projection3D), dtype="float32")
+    f = (multiplier * scipy.fft.fftshift(r)).astype("float32")
+    f.flags.writeable = False
+    return f
 
-    for i in range(0, projectionsNum):
-        IMG = scipy.fftpack.fft2(projection3D[:, i, :])
-        fimg = IMG * f_2d
-        filtered[:, i, :] = np.real(scipy.fftpack.ifft2(fimg))
-    return multiplier * filtered
+
+def _filtersinc3D(projection3D: np.ndarray):
+    """Applies a 3D filter to 3D projection data for FBP
+
+    Args:
+        projection3D (np.ndarray): projection data
+
+    Returns:
+        np.ndarray: Filtered data
+    """
+    [DetectorsLengthV, projectionsNum, DetectorsLengthH] = np.shape(projection3D)
+    # the filter depends on the horizontal frequency only, so a batched real FFT
+    # along the detector rows is sufficient. For real data the real part of the
+    # full inverse FFT equals the inverse real FFT with the Hermitian-symmetric
+    # part of the filter, which differs from the filter itself for odd widths.
+    f = _sinc_filter(DetectorsLengthH, projectionsNum)
+    half = np.arange(DetectorsLengthH // 2 + 1)
+    f_r = 0.5 * (f[half] + f[-half % DetectorsLengthH])
+
+    with scipy.fft.set_backend(_FFT_BACKEND):
+        filtered = scipy.fft.rfft(projection3D, axis=-1, workers=_WORKERS)
+        filtered *= f_r
+        return scipy.fft.irfft(
+            filtered, n=DetectorsLengthH, axis=-1, workers=_WORKERS, overwrite_x=True
+        )
 
 
 def _filtersinc2D(sinogram):
     # applies filters to __2D projection data__ in order to achieve FBP
-    a = 1.1
     [projectionsNum, DetectorsLengthH] = np.shape(sinogram)
-    w = np.linspace(
-        -np.pi,
-        np.pi - (2 * np.pi) / DetectorsLengthH,
-        DetectorsLengthH,
-        dtype="float32",
-    )
+    f = _sinc_filter(DetectorsLengthH, projectionsNum)
 
-    rn1 = np.abs(2.0 / a * np.sin(a * w / 2.0))
-    rn2 = np.sin(a * w / 2.0)
-    rd = (a * w) / 2.0
-    rd_c = np.zeros([1, DetectorsLengthH])
-    rd_c[0, :] = rd
-    r = rn1 * (np.dot(rn2, np.linalg.pinv(rd_c))) ** 2
-    multiplier = 1.0 / projectionsNum
-    f = scipy.fftpack.fftshift(r)
-    filtered = np.zeros(np.shape(sinogram))
-
-    for i in range(0, projectionsNum):
-        IMG = scipy.fftpack.fft(sinogram[i, :])
-        fimg = IMG * f
-        filtered[i, :] = multiplier * np.real(scipy.fftpack.ifft(fimg))
-    return np.float32(filtered)
+    with scipy.fft.set_backend(_FFT_BACKEND):
+        filtered = scipy.fft.fft(sinogram, axis=1, workers=_WORKERS)
+        filtered *= f
+        filtered = scipy.fft.ifft(filtered, axis=1, workers=_WORKERS, overwrite_x=True)
+    return np.float32(np.real(filtered))
 
 
 class RecToolsDIR:
@@ -103,6 +125,7 @@ class RecToolsDIR:
         device_projector="gpu",  # Choose the device  to be 'cpu' or 'gpu' OR provide a GPU index (integer) of a specific device
     ):
         device_projector, GPUdevice_index = _parse_device_argument(device_projector)
+        self._fourier_interpolators = {}
 
         if DetectorsDimV == 0 or DetectorsDimV is None:
             self.geom = "2D"
@@ -204,6 +227,56 @@ class RecToolsDIR:
         else:
             return self.Atools._backproj(_filtersinc3D(data))
 
+    def _fourier_interpolator(self, det_x_up: int, method: str):
+        """Prepares the interpolation from the polar samples of the FFT-ed sinogram
+        rows onto the regular 2D Fourier grid. It depends only on the geometry, so
+        the triangulation (or the nearest neighbours) is cached per detector size
+        and method.
+
+        Args:
+            det_x_up (int): The size of the oversampled detector.
+            method (str): Interpolation type (nearest, linear, or cubic).
+
+        Returns:
+            Callable: maps the flattened FFT-ed rows to the flattened 2D Fourier grid.
+        """
+        key = (det_x_up, method)
+        if key in self._fourier_interpolators:
+            return self._fourier_interpolators[key]
+
+        # Coordinates of sinogram FFT-ed rows' samples in 2D FFT space
+        a = -self.Atools.angles_vec
+        r = np.arange(det_x_up) - det_x_up / 2
+        r, a = np.meshgrid(r, a)
+        r = r.flatten()
+        a = a.flatten()
+        srcx = (det_x_up / 2) + r * np.cos(a)
+        srcy = (det_x_up / 2) + r * np.sin(a)
+        src = np.column_stack((srcy, srcx))
+
+        # Coordinates of regular grid in 2D FFT space
+        dstx, dsty = np.meshgrid(np.arange(det_x_up), np.arange(det_x_up))
+        dst = np.column_stack((dsty.flatten(), dstx.flatten()))
+
+        if method == "nearest":
+            indices = scipy.spatial.cKDTree(src).query(dst)[1]
+
+            def interpolate(values):
+                return values[indices]
+
+        else:
+            triangulation = scipy.spatial.Delaunay(src)
+            if method == "linear":
+                interpolator = scipy.interpolate.LinearNDInterpolator
+            else:
+                interpolator = scipy.interpolate.CloughTocher2DInterpolator
+
+            def interpolate(values):
+                return interpolator(triangulation, values, fill_value=0.0)(dst)
+
+        self._fourier_interpolators[key] = interpolate
+        return interpolate
+
     def FOURIER(self, data: np.ndarray, **kwargs) -> np.ndarray:
         """2D Reconstruction using Fourier slice theorem (scipy required)
         for griddata interpolation module choose nearest, linear or cubic
@@ -224,6 +297,7 @@ class RecToolsDIR:
                 "Fourier method is currently for 2D data only, use FBP if 3D reconstruction needed"
             )
 
+        method = "linear"  # default value
         for key, value in kwargs.items():
             if key == "data_axes_labels_order" and value is not None:
                 data = _data_dims_swapper(data, value, ["angles", "detX"])
@@ -235,9 +309,6 @@ class RecToolsDIR:
                 else:
                     method = value
 
-        from scipy.fft import fftshift, ifftshift, fft, ifft2
-        from scipy.interpolate import griddata
-
         ObjSize = self.Atools.recon_size
         # pad sinogram and move it to compensate for CoR
         oversampling = 2  # 2 or larger
@@ -253,30 +324,21 @@ class RecToolsDIR:
         sino_up[:, pad_from:pad_to] = data
 
         # Fourier transform the rows of the sinogram, move the DC component to the row's centre
-        sinogram_fft_rows = fftshift(fft(ifftshift(sino_up, axes=1)), axes=1)
-        # Coordinates of sinogram FFT-ed rows' samples in 2D FFT space
-        a = -self.Atools.angles_vec
-        r = np.arange(det_x_up) - det_x_up / 2
-        r, a = np.meshgrid(r, a)
-        r = r.flatten()
-        a = a.flatten()
-        srcx = (det_x_up / 2) + r * np.cos(a)
-        srcy = (det_x_up / 2) + r * np.sin(a)
-
-        # Coordinates of regular grid in 2D FFT space
-        dstx, dsty = np.meshgrid(np.arange(det_x_up), np.arange(det_x_up))
-        dstx = dstx.flatten()
-        dsty = dsty.flatten()
+        sinogram_fft_rows = scipy.fft.fftshift(
+            scipy.fft.fft(
+                scipy.fft.ifftshift(sino_up, axes=1), axis=1, workers=_WORKERS
+            ),
+            axes=1,
+        )
         # Interpolate the 2D Fourier space grid from the transformed sinogram rows
-        fft2 = griddata(
-            (srcy, srcx),
-            sinogram_fft_rows.flatten(),
-            (dsty, dstx),
-            method,
-            fill_value=0.0,
-        ).reshape((det_x_up, det_x_up))
+        interpolate = self._fourier_interpolator(det_x_up, method)
+        fft2 = interpolate(sinogram_fft_rows.flatten()).reshape((det_x_up, det_x_up))
         # Transform from 2D Fourier space back to a reconstruction of the target
-        recon = np.real(fftshift(ifft2(ifftshift(fft2))))
+        recon = np.real(
+            scipy.fft.fftshift(
+                scipy.fft.ifft2(scipy.fft.ifftshift(fft2), workers=_WORKERS)
+            )
+        )
 
         # Cropping the reconstruction to size of the original image
         unpad_from = det_x_up // 2 - ObjSize // 2
@@ -121,18 +121,24 @@ class RecToolsDIRCuPy(RecToolsDIR):
             xp.ndarray: The FBP reconstructed volume as a CuPy array.
         """
         cutoff_freq = 0.6  # default value
+        data_axes_labels_order = ["angles", "detY", "detX"]  # default value
         for key, value in kwargs.items():
             if key == "data_axes_labels_order" and value is not None:
-                data = _data_dims_swapper(data, value, ["angles", "detY", "detX"])
+                data_axes_labels_order = value
             if key == "cutoff_freq" and value is not None:
                 cutoff_freq = value
 
+        # the filter runs along detX only, so the data is brought straight into the
+        # ["detY", "angles", "detX"] order of the backprojector before filtering
+        data = _data_dims_swapper(
+            data, data_axes_labels_order, ["detY", "angles", "detX"]
+        )
+
         # filter the data on the GPU and keep the result there
         data = _filtersinc3D_cupy(data, cutoff=cutoff_freq)
         xp._default_memory_pool.free_all_blocks()
         cache = xp.fft.config.get_plan_cache()
         cache.clear()  # flush FFT cache here before backprojection operation
-        data = xp.ascontiguousarray(xp.swapaxes(data, 0, 1))
         reconstruction = self.Atools._backprojCuPy(data)  # 3d backprojecting
         xp._default_memory_pool.free_all_blocks()
         return _check_kwargs(reconstruction, **kwargs)
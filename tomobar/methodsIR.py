@@ -9,8 +9,9 @@
 * SIRT, CGLS algorithms wrapped directly from the ASTRA package
 """
 
+import inspect
+import numpy as np
 import numpy as xp
-from numpy import linalg
 from typing import Union
 
 try:
@@ -37,6 +38,59 @@ from tomobar.astra_wrappers.astra_tools2d import AstraTools2D
 from tomobar.astra_wrappers.astra_tools3d import AstraTools3D
 
 
+def _swls_residual(res, weights, denom_inv, xp):
+    """Applies the Stripe-Weighted Least-squares weighting to the residual in-place,
+    for all detector columns at once (the angles are along the axis -2).
+
+    Args:
+        res (xp.ndarray): The residual, overwritten with the weighted residual.
+        weights (xp.ndarray): The raw data weights of the same shape.
+        denom_inv (xp.ndarray): 1/(sum of the weights over angles + beta_SWLS).
+        xp (module): numpy or cupy.
+
+    Returns:
+        xp.ndarray: The weighted residual.
+    """
+    dots = xp.einsum("...ad,...ad->...d", weights, res)
+    dots *= denom_inv
+    res *= weights
+    res -= xp.expand_dims(dots, -2) * weights
+    return res
+
+
+def _anderson_mixing(g, f, dG_hist, dF_hist, xp):
+    """Anderson (type-II) mixing of a fixed-point iterate. The coefficients minimise
+    the norm of the combined residuals and are found from the small normal
+    equations of the stored residual differences.
+
+    Args:
+        g (xp.ndarray): The new iterate of the fixed-point map.
+        f (xp.ndarray): Its residual (the new minus the previous iterate).
+        dG_hist (list): Differences of the consecutive iterates.
+        dF_hist (list): Differences of the consecutive residuals.
+        xp (module): numpy or cupy.
+
+    Returns:
+        xp.ndarray: The accelerated iterate or g itself if there is no history.
+    """
+    depth = len(dF_hist)
+    if depth == 0:
+        return g
+    gram = np.empty((depth, depth))
+    rhs = np.empty(depth)
+    for i in range(depth):
+        rhs[i] = float(xp.dot(dF_hist[i], f))
+        for j in range(i, depth):
+            gram[i, j] = gram[j, i] = float(xp.dot(dF_hist[i], dF_hist[j]))
+    gamma = np.linalg.lstsq(gram, rhs, rcond=None)[0]
+    if not np.all(np.isfinite(gamma)):
+        return g
+    g_mixed = g.copy()
+    for i in range(depth):
+        g_mixed -= np.float32(gamma[i]) * dG_hist[i]
+    return g_mixed
+
+
 class RecToolsIR:
     """Iterative reconstruction algorithms (FISTA and ADMM) using ASTRA toolbox and CCPi-RGL toolkit.
     Parameters for reconstruction algorithms are extracted from three dictionaries:
@@ -229,53 +283,49 @@ class RecToolsIR:
             else:
                 y = self.Atools._forwproj(x1)
             if self.datafidelity == "PWLS":
-                y = xp.multiply(sqweight, y)
+                y *= sqweight
             for iterations in range(power_iterations):
                 if cupy_imported and self.cupyrun:
                     x1 = self.Atools._backprojCuPy(y)
-                else:
-                    x1 = self.Atools._backproj(y)
-                if cupy_imported and self.cupyrun:
                     s = cp.linalg.norm(cp.ravel(x1), axis=0)
                 else:
+                    x1 = self.Atools._backproj(y)
                     s = xp.linalg.norm(xp.ravel(x1), axis=0)
-                x1 = x1 / s
+                x1 /= s
                 if cupy_imported and self.cupyrun:
                     y = self.Atools._forwprojCuPy(x1)
                 else:
                     y = self.Atools._forwproj(x1)
                 if self.datafidelity == "PWLS":
-                    y = xp.multiply(sqweight, y)
+                    y *= sqweight
         else:
             # OS approach
+            if self.datafidelity == "PWLS":
+                # the weights of the first subset are selected only once
+                if self.geom == "2D":
+                    sqweight = sqweight[self.Atools.indVec_OS[0], :]
+                else:
+                    sqweight = sqweight[:, self.Atools.indVec_OS[0], :]
             if cupy_imported and self.cupyrun:
                 y = self.Atools._forwprojOSCuPy(x1, 0)
             else:
                 y = self.Atools._forwprojOS(x1, 0)
             if self.datafidelity == "PWLS":
-                if self.geom == "2D":
-                    y = xp.multiply(sqweight[self.Atools.newInd_Vec[0, :], :], y)
-                else:
-                    y = xp.multiply(sqweight[:, self.Atools.newInd_Vec[0, :], :], y)
+                y *= sqweight
             for iterations in range(power_iterations):
                 if cupy_imported and self.cupyrun:
                     x1 = self.Atools._backprojOSCuPy(y, 0)
-                else:
-                    x1 = self.Atools._backprojOS(y, 0)
-                if cupy_imported and self.cupyrun:
                     s = cp.linalg.norm(cp.ravel(x1), axis=0)
                 else:
+                    x1 = self.Atools._backprojOS(y, 0)
                     s = xp.linalg.norm(xp.ravel(x1), axis=0)
-                x1 = x1 / s
+                x1 /= s
                 if cupy_imported and self.cupyrun:
                     y = self.Atools._forwprojOSCuPy(x1, 0)
                 else:
                     y = self.Atools._forwprojOS(x1, 0)
                 if self.datafidelity == "PWLS":
-                    if self.geom == "2D":
-                        y = xp.multiply(sqweight[self.Atools.newInd_Vec[0, :], :], y)
-                    else:
-                        y = xp.multiply(sqweight[:, self.Atools.newInd_Vec[0, :], :], y)
+                    y *= sqweight
         return s
 
     def FISTA(
@@ -350,47 +400,66 @@ class RecToolsIR:
         denomN = 1.0 / xp.size(X)
         X_t = xp.copy(X)
         r_x = r.copy()
+        # the data of every subset is gathered once instead of fancy-indexing
+        # (and copying) it in each iteration
+        if _data_upd_["OS_number"] > 1:
+            norm_slabs = [
+                _data_upd_["projection_norm_data"][..., indVec, :]
+                for indVec in self.Atools.indVec_OS
+            ]
+            if self.datafidelity in ["PWLS", "SWLS"]:
+                raw_slabs = [
+                    _data_upd_["projection_raw_data"][..., indVec, :]
+                    for indVec in self.Atools.indVec_OS
+                ]
+        else:
+            norm_slabs = [_data_upd_["projection_norm_data"]]
+            if self.datafidelity in ["PWLS", "SWLS"]:
+                raw_slabs = [_data_upd_["projection_raw_data"]]
+        if self.datafidelity == "SWLS":
+            # the SWLS normalisation depends only on the raw data and beta_SWLS,
+            # so it is computed once per subset rather than in every iteration
+            beta_SWLS = xp.asarray(_data_upd_["beta_SWLS"], dtype="float32")
+            swls_denom_inv = [
+                1.0 / (weights.sum(axis=-2) + beta_SWLS) for weights in raw_slabs
+            ]
+        # the residuals and the gradients are written into buffers allocated once
+        res_bufs = [xp.empty(xp.shape(slab), "float32") for slab in norm_slabs]
+        grad_bufs = [xp.empty(xp.shape(X), "float32") for _ in range(2)]
+        # the stopping criterion is only evaluated for a positive tolerance and
+        # compares squared norms to avoid the square root
+        if _algorithm_upd_["tolerance"] > 0.0:
+            tolerance_sq = (_algorithm_upd_["tolerance"] / denomN) ** 2
+        if (_algorithm_upd_["tolerance"] > 0.0) or (
+            _algorithm_upd_["fista_mode"] == "restart"
+        ):
+            diff_buf = xp.empty(xp.shape(X), "float32")
+        updates_no = 0  # the number of (subset) updates for the CD momentum
+        verbose_step = round(_algorithm_upd_["iterations"] / 5) + 1
         # Outer FISTA iterations
         for iter_no in range(_algorithm_upd_["iterations"]):
             r_old = r
+            if (_data_upd_["ringGH_lambda"] is not None) and (iter_no > 0):
+                # the GH ring term is constant over the subsets of an outer iteration
+                if self.geom == "2D":
+                    ring_term = _data_upd_["ringGH_accelerate"] * r_x[:, 0]
+                else:
+                    ring_term = _data_upd_["ringGH_accelerate"] * r_x[:, xp.newaxis, :]
             # Do GH fidelity pre-calculations using the full projections dataset for OS version
             if (
                 (_data_upd_["OS_number"] != 1)
                 and (_data_upd_["ringGH_lambda"] is not None)
                 and (iter_no > 0)
             ):
+                # all angles are projected in one call instead of looping over the subsets
+                res = self.Atools._forwproj(X_t) - _data_upd_["projection_norm_data"]
                 if self.geom == "2D":
-                    vec = xp.zeros((self.Atools.detectors_x))
-                else:
-                    vec = xp.zeros((self.Atools.detectors_y, self.Atools.detectors_x))
-                for sub_ind in range(_data_upd_["OS_number"]):
-                    # select a specific set of indeces for the subset (OS)
-                    indVec = self.Atools.newInd_Vec[sub_ind, :]
-                    if indVec[self.Atools.NumbProjBins - 1] == 0:
-                        indVec = indVec[:-1]  # shrink vector size
-                    if self.geom == "2D":
-                        res = (
-                            self.Atools._forwprojOS(X_t, sub_ind)
-                            - _data_upd_["projection_norm_data"][indVec, :]
-                        )
-                        res[:, 0:None] = (
-                            res[:, 0:None] + _data_upd_["ringGH_accelerate"] * r_x[:, 0]
-                        )
-                        vec = vec + (1.0 / (_data_upd_["OS_number"])) * res.sum(axis=0)
-                    else:
-                        res = (
-                            self.Atools._forwprojOS(X_t, sub_ind)
-                            - _data_upd_["projection_norm_data"][:, indVec, :]
-                        )
-                        for ang_index in range(len(indVec)):
-                            res[:, ang_index, :] = (
-                                res[:, ang_index, :]
-                                + _data_upd_["ringGH_accelerate"] * r_x
-                            )
-                        vec = res.sum(axis=1)
-                if self.geom == "2D":
+                    res += ring_term
+                    vec = (1.0 / (_data_upd_["OS_number"])) * res.sum(axis=0)
                     r[:, 0] = r_x[:, 0] - xp.multiply(L_const_inv, vec)
                 else:
+                    res += ring_term
+                    vec = (1.0 / (_data_upd_["OS_number"])) * res.sum(axis=1)
                     r = r_x - xp.multiply(L_const_inv, vec)
 
             # loop over subsets (OS)
@@ -398,249 +467,173 @@ class RecToolsIR:
                 X_old = X
                 t_old = t
                 if _data_upd_["OS_number"] > 1:
-                    # select a specific set of indeces for the subset (OS)
-                    indVec = self.Atools.newInd_Vec[sub_ind, :]
-                    if indVec[self.Atools.NumbProjBins - 1] == 0:
-                        indVec = indVec[:-1]  # shrink vector size
                     # OS-reduced residuals
                     if self.geom == "2D":
                         if self.datafidelity == "LS":
                             # 2D Least-squares (LS) data fidelity - OS (linear)
-                            res = (
-                                self.Atools._forwprojOS(X_t, sub_ind)
-                                - _data_upd_["projection_norm_data"][indVec, :]
+                            res = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
                             )
+                            res -= norm_slabs[sub_ind]
                         if self.datafidelity == "PWLS":
                             # 2D Penalised Weighted Least-squares - OS data fidelity (approximately linear)
-                            res = xp.multiply(
-                                _data_upd_["projection_raw_data"][indVec, :],
-                                (
-                                    self.Atools._forwprojOS(X_t, sub_ind)
-                                    - _data_upd_["projection_norm_data"][indVec, :]
-                                ),
+                            res = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
                             )
+                            res -= norm_slabs[sub_ind]
+                            res *= raw_slabs[sub_ind]
                         if self.datafidelity == "SWLS":
                             # 2D Stripe-Weighted Least-squares - OS data fidelity (helps to minimise stripe arifacts)
-                            res = (
-                                self.Atools._forwprojOS(X_t, sub_ind)
-                                - _data_upd_["projection_norm_data"][indVec, :]
+                            res = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
+                            )
+                            res -= norm_slabs[sub_ind]
+                            res = _swls_residual(
+                                res,
+                                raw_slabs[sub_ind],
+                                swls_denom_inv[sub_ind],
+                                xp,
                             )
-                            for det_index in range(self.Atools.detectors_x):
-                                wk = _data_upd_["projection_raw_data"][
-                                    indVec, det_index
-                                ]
-                                res[:, det_index] = (
-                                    xp.multiply(wk, res[:, det_index])
-                                    - 1.0
-                                    / (xp.sum(wk) + _data_upd_["beta_SWLS"][det_index])
-                                    * (wk.dot(res[:, det_index]))
-                                    * wk
-                                )
                         if self.datafidelity == "KL":
                             # 2D Kullback-Leibler (KL) data fidelity - OS
-                            tmp = self.Atools._forwprojOS(X_t, sub_ind)
-                            res = xp.divide(
-                                tmp - _data_upd_["projection_norm_data"][indVec, :],
-                                tmp + 1.0,
+                            tmp = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
                             )
+                            res = tmp - norm_slabs[sub_ind]
+                            tmp += 1.0
+                            res /= tmp
                         # ring removal part for Group-Huber (GH) fidelity (2D)
                         if (_data_upd_["ringGH_lambda"] is not None) and (iter_no > 0):
-                            res[:, 0:None] = (
-                                res[:, 0:None]
-                                + _data_upd_["ringGH_accelerate"] * r_x[:, 0]
-                            )
+                            res += ring_term
                     else:  # 3D
                         if self.datafidelity == "LS":
                             # 3D Least-squares (LS) data fidelity - OS (linear)
-                            res = (
-                                self.Atools._forwprojOS(X_t, sub_ind)
-                                - _data_upd_["projection_norm_data"][:, indVec, :]
+                            res = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
                             )
+                            res -= norm_slabs[sub_ind]
                         if self.datafidelity == "PWLS":
                             # 3D Penalised Weighted Least-squares - OS data fidelity (approximately linear)
-                            res = xp.multiply(
-                                _data_upd_["projection_raw_data"][:, indVec, :],
-                                (
-                                    self.Atools._forwprojOS(X_t, sub_ind)
-                                    - _data_upd_["projection_norm_data"][:, indVec, :]
-                                ),
+                            res = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
                             )
+                            res -= norm_slabs[sub_ind]
+                            res *= raw_slabs[sub_ind]
                         if self.datafidelity == "SWLS":
                             # 3D Stripe-Weighted Least-squares - OS data fidelity (helps to minimise stripe arifacts)
-                            res = (
-                                self.Atools._forwprojOS(X_t, sub_ind)
-                                - _data_upd_["projection_norm_data"][:, indVec, :]
+                            res = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
+                            )
+                            res -= norm_slabs[sub_ind]
+                            res = _swls_residual(
+                                res,
+                                raw_slabs[sub_ind],
+                                swls_denom_inv[sub_ind],
+                                xp,
                             )
-                            for detVert_index in range(self.Atools.detectors_y):
-                                for detHorz_index in range(self.Atools.detectors_x):
-                                    wk = _data_upd_["projection_raw_data"][
-                                        detVert_index, indVec, detHorz_index
-                                    ]
-                                    res[detVert_index, :, detHorz_index] = (
-                                        xp.multiply(
-                                            wk, res[detVert_index, :, detHorz_index]
-                                        )
-                                        - 1.0
-                                        / (
-                                            xp.sum(wk)
-                                            + _data_upd_["beta_SWLS"][detHorz_index]
-                                        )
-                                        * (wk.dot(res[detVert_index, :, detHorz_index]))
-                                        * wk
-                                    )
                         if self.datafidelity == "KL":
                             # 3D Kullback-Leibler (KL) data fidelity - OS
-                            tmp = self.Atools._forwprojOS(X_t, sub_ind)
-                            res = xp.divide(
-                                tmp - _data_upd_["projection_norm_data"][:, indVec, :],
-                                tmp + 1.0,
+                            tmp = self.Atools._forwprojOS(
+                                X_t, sub_ind, out=res_bufs[sub_ind]
                             )
+                            res = tmp - norm_slabs[sub_ind]
+                            tmp += 1.0
+                            res /= tmp
                         # GH - fidelity part (3D)
                         if (_data_upd_["ringGH_lambda"] is not None) and (iter_no > 0):
-                            for ang_index in range(len(indVec)):
-                                res[:, ang_index, :] = (
-                                    res[:, ang_index, :]
-                                    + _data_upd_["ringGH_accelerate"] * r_x
-                                )
+                            res += ring_term
                 else:  # CLASSICAL all-data approach
                     if self.datafidelity == "LS":
                         # full residual for LS fidelity
-                        res = (
-                            self.Atools._forwproj(X_t)
-                            - _data_upd_["projection_norm_data"]
-                        )
+                        res = self.Atools._forwproj(X_t, out=res_bufs[0])
+                        res -= _data_upd_["projection_norm_data"]
                     if self.datafidelity == "PWLS":
                         # full gradient for the PWLS fidelity
-                        res = xp.multiply(
-                            _data_upd_["projection_raw_data"],
-                            (
-                                self.Atools._forwproj(X_t)
-                                - _data_upd_["projection_norm_data"]
-                            ),
-                        )
+                        res = self.Atools._forwproj(X_t, out=res_bufs[0])
+                        res -= _data_upd_["projection_norm_data"]
+                        res *= _data_upd_["projection_raw_data"]
                     if self.datafidelity == "KL":
                         # Kullback-Leibler (KL) data fidelity
-                        tmp = self.Atools._forwproj(X_t)
-                        res = xp.divide(
-                            tmp - _data_upd_["projection_norm_data"], tmp + 1.0
-                        )
+                        tmp = self.Atools._forwproj(X_t, out=res_bufs[0])
+                        res = tmp - _data_upd_["projection_norm_data"]
+                        tmp += 1.0
+                        res /= tmp
                     if (_data_upd_["ringGH_lambda"] is not None) and (iter_no > 0):
                         if self.geom == "2D":
-                            res[0:None, :] = (
-                                res[0:None, :]
-                                + _data_upd_["ringGH_accelerate"] * r_x[:, 0]
-                            )
+                            res += ring_term
                             vec = res.sum(axis=0)
                             r[:, 0] = r_x[:, 0] - xp.multiply(L_const_inv, vec)
                         else:  # 3D case
-                            for ang_index in range(len(self.Atools.angles_vec)):
-                                res[:, ang_index, :] = (
-                                    res[:, ang_index, :]
-                                    + _data_upd_["ringGH_accelerate"] * r_x
-                                )
-                                vec = res.sum(axis=1)
-                                r = r_x - xp.multiply(L_const_inv, vec)
+                            res += ring_term
+                            vec = res.sum(axis=1)
+                            r = r_x - xp.multiply(L_const_inv, vec)
                     if self.datafidelity == "SWLS":
-                        res = (
-                            self.Atools._forwproj(X_t)
-                            - _data_upd_["projection_norm_data"]
+                        res = self.Atools._forwproj(X_t, out=res_bufs[0])
+                        res -= _data_upd_["projection_norm_data"]
+                        res = _swls_residual(
+                            res,
+                            _data_upd_["projection_raw_data"],
+                            swls_denom_inv[0],
+                            xp,
                         )
-                        if self.geom == "2D":
-                            for det_index in range(self.Atools.detectors_x):
-                                wk = _data_upd_["projection_raw_data"][:, det_index]
-                                res[:, det_index] = (
-                                    xp.multiply(wk, res[:, det_index])
-                                    - 1.0
-                                    / (xp.sum(wk) + _data_upd_["beta_SWLS"][det_index])
-                                    * (wk.dot(res[:, det_index]))
-                                    * wk
-                                )
-                        else:  # 3D case
-                            for detVert_index in range(self.Atools.detectors_y):
-                                for detHorz_index in range(self.Atools.detectors_x):
-                                    wk = _data_upd_["projection_raw_data"][
-                                        detVert_index, :, detHorz_index
-                                    ]
-                                    res[detVert_index, :, detHorz_index] = (
-                                        xp.multiply(
-                                            wk, res[detVert_index, :, detHorz_index]
-                                        )
-                                        - 1.0
-                                        / (
-                                            xp.sum(wk)
-                                            + _data_upd_["beta_SWLS"][detHorz_index]
-                                        )
-                                        * (wk.dot(res[detVert_index, :, detHorz_index]))
-                                        * wk
-                                    )
+                # write the gradient into the buffer that does not hold X_old
+                grad_buf = grad_bufs[1] if grad_bufs[0] is X_old else grad_bufs[0]
                 if _data_upd_["huber_threshold"] is not None:
-                    # apply Huber penalty
-                    multHuber = xp.ones(xp.shape(res))
-                    multHuber[
-                        (xp.where(xp.abs(res) > _data_upd_["huber_threshold"]))
-                    ] = xp.divide(
-                        _data_upd_["huber_threshold"],
-                        xp.abs(
-                            res[(xp.where(xp.abs(res) > _data_upd_["huber_threshold"]))]
-                        ),
+                    # apply Huber penalty, the residual is scaled by min(1, t/|res|)
+                    res *= _data_upd_["huber_threshold"] / xp.maximum(
+                        xp.abs(res), _data_upd_["huber_threshold"]
                     )
-                    if _data_upd_["OS_number"] != 1:
-                        # OS-Huber-gradient
-                        grad_fidelity = self.Atools._backprojOS(
-                            xp.multiply(multHuber, res), sub_ind
-                        )
-                    else:
-                        # full Huber gradient
-                        grad_fidelity = self.Atools._backproj(
-                            xp.multiply(multHuber, res)
-                        )
                 elif _data_upd_["studentst_threshold"] is not None:
                     # apply Students't penalty
-                    multStudent = xp.ones(xp.shape(res))
-                    multStudent = xp.divide(
-                        2.0, _data_upd_["studentst_threshold"] ** 2 + res**2
-                    )
-                    if _data_upd_["OS_number"] != 1:
-                        # OS-Students't-gradient
-                        grad_fidelity = self.Atools._backprojOS(
-                            xp.multiply(multStudent, res), sub_ind
-                        )
-                    else:
-                        # full Students't gradient
-                        grad_fidelity = self.Atools._backproj(
-                            xp.multiply(multStudent, res)
-                        )
+                    res *= 2.0 / (_data_upd_["studentst_threshold"] ** 2 + res**2)
+                if _data_upd_["OS_number"] != 1:
+                    # OS reduced gradient
+                    grad_fidelity = self.Atools._backprojOS(res, sub_ind, out=grad_buf)
                 else:
-                    if _data_upd_["OS_number"] != 1:
-                        # OS reduced gradient
-                        grad_fidelity = self.Atools._backprojOS(res, sub_ind)
-                    else:
-                        # full gradient
-                        grad_fidelity = self.Atools._backproj(res)
-
-                X = X_t - L_const_inv * grad_fidelity
-                if _algorithm_upd_["nonnegativity"] == "ENABLE":
-                    X[X < 0.0] = 0.0
+                    # full gradient
+                    grad_fidelity = self.Atools._backproj(res, out=grad_buf)
+
+                # gradient step done in-place in the back-projected buffer
+                X = grad_fidelity
+                X *= -L_const_inv
+                X += X_t
+                if _algorithm_upd_["nonnegativity"]:
+                    xp.maximum(X, 0.0, out=X)
                 if _algorithm_upd_["recon_mask_radius"] is not None:
                     X = circ_mask(
-                        X, _algorithm_upd_["recon_mask_radius"]
-                    )  # applying a circular mask
+                        X, _algorithm_upd_["recon_mask_radius"], out=X
+                    )  # applying a circular mask in-place
                 if _regularisation_upd_["method"] is not None:
                     ##### The proximal operator of the chosen regulariser #####
                     (X, info_vec) = prox_regul(self, X, _regularisation_upd_)
                     ###########################################################
+                if _algorithm_upd_["fista_mode"] == "restart":
+                    # gradient-based adaptive restart: the momentum is dropped when
+                    # it points against the descent direction
+                    xp.subtract(X, X_old, out=diff_buf)
+                    X_t -= X
+                    if xp.dot(X_t.ravel(), diff_buf.ravel()) > 0.0:
+                        t_old = t = 1.0
                 # updating t variable
-                t = (1.0 + xp.sqrt(1.0 + 4.0 * t**2)) * 0.5
-                X_t = X + ((t_old - 1.0) / t) * (X - X_old)  # updating X
+                if _algorithm_upd_["fista_mode"] == "CD":
+                    # Chambolle-Dossal rule t_k = (k + a - 1) / a with a = 4
+                    updates_no += 1
+                    t = (updates_no + 4.0) / 4.0
+                else:
+                    t = (1.0 + xp.sqrt(1.0 + 4.0 * t**2)) * 0.5
+                # updating X_t in-place without creating temporary arrays
+                xp.subtract(X, X_old, out=X_t)
+                X_t *= (t_old - 1.0) / t
+                X_t += X
             if (_data_upd_["ringGH_lambda"] is not None) and (iter_no > 0):
-                r = xp.maximum(
-                    (xp.abs(r) - _data_upd_["ringGH_lambda"]), 0.0
-                ) * xp.sign(
-                    r
-                )  # soft-thresholding operator for ring vector
+                # soft-thresholding operator for ring vector (r_old keeps the old r)
+                r_shrunk = xp.abs(r)
+                r_shrunk -= _data_upd_["ringGH_lambda"]
+                xp.maximum(r_shrunk, 0.0, out=r_shrunk)
+                r = xp.copysign(r_shrunk, r, out=r_shrunk)
                 r_x = r + ((t_old - 1.0) / t) * (r - r_old)  # updating r
             if _algorithm_upd_["verbose"]:
-                if xp.mod(iter_no, (round)(_algorithm_upd_["iterations"] / 5) + 1) == 0:
+                if iter_no % verbose_step == 0:
                     print(
                         "FISTA iteration (",
                         iter_no + 1,
@@ -653,11 +646,13 @@ class RecToolsIR:
                 if iter_no == _algorithm_upd_["iterations"] - 1:
                     print("FISTA stopped at iteration (", iter_no + 1, ")")
             # stopping criteria (checked only after a reasonable number of iterations)
-            if ((iter_no > 10) and (_data_upd_["OS_number"] > 1)) or (
-                (iter_no > 150) and (_data_upd_["OS_number"] == 1)
+            if (_algorithm_upd_["tolerance"] > 0.0) and (
+                ((iter_no > 10) and (_data_upd_["OS_number"] > 1))
+                or ((iter_no > 150) and (_data_upd_["OS_number"] == 1))
             ):
-                nrm = linalg.norm(X - X_old) * denomN
-                if nrm < _algorithm_upd_["tolerance"]:
+                xp.subtract(X, X_old, out=diff_buf)
+                nrm_sq = xp.dot(diff_buf.ravel(), diff_buf.ravel())
+                if nrm_sq < tolerance_sq:
                     if _algorithm_upd_["verbose"]:
                         print("FISTA stopped at iteration (", iter_no + 1, ")")
                     break
@@ -699,10 +694,16 @@ class RecToolsIR:
         )
         ######################################################################
 
+        # the augmented Lagrangian parameter (it can change if ADMM_rho_adaptive is set)
+        rho = _algorithm_upd_["ADMM_rho_const"]
+        # the proximal step takes the regularisation parameters relative to the
+        # initial rho, they are rescaled when rho adapts to keep the same problem
+        regularisation_prox = dict(_regularisation_upd_)
+
         def ADMM_Ax(x):
             data_upd = self.Atools.A_optomo(x)
             x_temp = self.Atools.A_optomo.transposeOpTomo(data_upd)
-            x_upd = x_temp + _algorithm_upd_["ADMM_rho_const"] * x
+            x_upd = x_temp + rho * x
             return x_upd
 
         def ADMM_Atb(b):
@@ -710,6 +711,14 @@ class RecToolsIR:
             return b
 
         (data_dim, rec_dim) = xp.shape(self.Atools.A_optomo)
+        if self.geom == "2D":
+            recon_shape = (self.Atools.recon_size, self.Atools.recon_size)
+        else:
+            recon_shape = (
+                self.Atools.detectors_y,
+                self.Atools.recon_size,
+                self.Atools.recon_size,
+            )
 
         # initialise the solution and other ADMM variables
         if xp.size(_algorithm_upd_["initialise"]) == rec_dim:
@@ -725,50 +734,117 @@ class RecToolsIR:
         b_to_solver_const = self.Atools.A_optomo.transposeOpTomo(
             _data_upd_["projection_norm_data"].ravel()
         )
+        # the operator of the quadratic problem is built once, ADMM_Ax reads the
+        # current rho when it is applied
+        A_to_solver = scipy.sparse.linalg.LinearOperator(
+            (rec_dim, rec_dim), matvec=ADMM_Ax, rmatvec=ADMM_Atb
+        )
+        # the x-subproblem is symmetric positive-definite, so CG can replace GMRES
+        if _algorithm_upd_["ADMM_solver"] == "cg":
+            linear_solver = scipy.sparse.linalg.cg
+        else:
+            linear_solver = scipy.sparse.linalg.gmres
+        # SciPy 1.12 renamed the relative tolerance of the solvers from tol to rtol
+        if "rtol" in inspect.signature(linear_solver).parameters:
+            solver_tolerance = {"rtol": 1e-05}
+        else:
+            solver_tolerance = {"tol": 1e-05}
+        # the right-hand side and the relaxed solution are formed in buffers
+        b_to_solver = xp.empty_like(b_to_solver_const)
+        x_hat = xp.empty(rec_dim, "float32")
+        # the proximal input is written into a buffer viewed in the volume shape
+        prox_in = xp.empty(rec_dim, "float32")
+        x_prox_reg = prox_in.reshape(recon_shape)
+        # the stopping criterion is only evaluated for a positive tolerance and
+        # compares squared norms to avoid the square root
+        if _algorithm_upd_["tolerance"] > 0.0:
+            diff_buf = xp.empty(rec_dim, "float32")
+            tolerance_sq = (_algorithm_upd_["tolerance"] / denomN) ** 2
+        verbose_step = round(_algorithm_upd_["iterations"] / 5) + 1
+        anderson_depth = _algorithm_upd_["ADMM_anderson_depth"]
+        if anderson_depth > 0:
+            # the last differences of the (z, u) iterates and of their residuals
+            dG_hist = []
+            dF_hist = []
+            g_prev = None
 
         # Outer ADMM iterations
         for iter_no in range(_algorithm_upd_["iterations"]):
             X_old = X
+            if anderson_depth > 0:
+                zu_in = xp.concatenate((z, u))
             # solving quadratic problem using linalg solver
-            A_to_solver = scipy.sparse.linalg.LinearOperator(
-                (rec_dim, rec_dim), matvec=ADMM_Ax, rmatvec=ADMM_Atb
-            )
-            b_to_solver = b_to_solver_const + _algorithm_upd_["ADMM_rho_const"] * (
-                z - u
+            xp.subtract(z, u, out=b_to_solver)
+            b_to_solver *= rho
+            b_to_solver += b_to_solver_const
+            outputSolver = linear_solver(
+                A_to_solver, b_to_solver, maxiter=15, **solver_tolerance
             )
-            outputSolver = scipy.sparse.linalg.gmres(
-                A_to_solver, b_to_solver, tol=1e-05, maxiter=15
-            )
-            X = xp.float32(outputSolver[0])  # get gmres solution
-            if _algorithm_upd_["nonnegativity"] == "ENABLE":
-                X[X < 0.0] = 0.0
-            # z-update with relaxation
-            zold = z.copy()
-            x_hat = (
-                _algorithm_upd_["ADMM_relax_par"] * X
-                + (1.0 - _algorithm_upd_["ADMM_relax_par"]) * zold
-            )
-            if self.geom == "2D":
-                x_prox_reg = (x_hat + u).reshape(
-                    [self.Atools.recon_size, self.Atools.recon_size]
-                )
-            if self.geom == "3D":
-                x_prox_reg = (x_hat + u).reshape(
-                    [
-                        self.Atools.detectors_y,
-                        self.Atools.recon_size,
-                        self.Atools.recon_size,
-                    ]
-                )
+            X = xp.float32(outputSolver[0])  # get the solver solution
+            if _algorithm_upd_["nonnegativity"]:
+                xp.maximum(X, 0.0, out=X)
+            # z-update with relaxation (x_hat is formed before the proximal step
+            # replaces z, so the old z needs no copy)
+            xp.multiply(X, _algorithm_upd_["ADMM_relax_par"], out=x_hat)
+            x_hat += (1.0 - _algorithm_upd_["ADMM_relax_par"]) * z
+            xp.add(x_hat, u, out=prox_in)
+            z_old = z
             # Apply regularisation using CCPi-RGL toolkit. The proximal operator of the chosen regulariser
             if _regularisation_upd_["method"] is not None:
                 # The proximal operator of the chosen regulariser
-                (z, info_vec) = prox_regul(self, x_prox_reg, _regularisation_upd_)
+                (z, info_vec) = prox_regul(self, x_prox_reg, regularisation_prox)
             z = z.ravel()
-            # update u variable
-            u = u + (x_hat - z)
+            if xp.may_share_memory(z, prox_in):
+                # a regulariser working in-place must not leave z in the buffer
+                z = z.copy()
+            # update u variable in-place (x_hat is not needed afterwards)
+            x_hat -= z
+            u += x_hat
+            if _algorithm_upd_["ADMM_rho_adaptive"] and (
+                iter_no < _algorithm_upd_["iterations"] // 2
+            ):
+                # residual balancing (Boyd et al. 2011, section 3.4.1), the scaled dual
+                # variable u is rescaled with the inverse factor. rho is kept fixed in
+                # the second half of the iterations to avoid oscillations.
+                primal_sq = xp.sum(xp.square(X - z))
+                dual_sq = rho**2 * xp.sum(xp.square(z - z_old))
+                rho_scale = 1.0
+                if primal_sq > 100.0 * dual_sq:
+                    rho_scale = 2.0
+                elif dual_sq > 100.0 * primal_sq:
+                    rho_scale = 0.5
+                if rho_scale != 1.0:
+                    rho *= rho_scale
+                    u /= rho_scale
+                    for key in ["regul_param", "regul_param2"]:
+                        if key in regularisation_prox:
+                            regularisation_prox[key] /= rho_scale
+                    if anderson_depth > 0:
+                        # the fixed-point map has changed
+                        dG_hist.clear()
+                        dF_hist.clear()
+                        g_prev = None
+            if anderson_depth > 0:
+                # Anderson acceleration of the (z, u) fixed-point map
+                g = xp.concatenate((z, u))
+                f = g - zu_in
+                if g_prev is not None:
+                    if xp.dot(f, f) > xp.dot(f_prev, f_prev):
+                        # restart when the residual grows
+                        dG_hist.clear()
+                        dF_hist.clear()
+                    else:
+                        dG_hist.append(g - g_prev)
+                        dF_hist.append(f - f_prev)
+                        if len(dF_hist) > anderson_depth:
+                            del dG_hist[0], dF_hist[0]
+                g_prev = g
+                f_prev = f
+                zu_mixed = _anderson_mixing(g, f, dG_hist, dF_hist, xp)
+                z = zu_mixed[:rec_dim].copy()
+                u = zu_mixed[rec_dim:].copy()
             if _algorithm_upd_["verbose"]:
-                if xp.mod(iter_no, (round)(_algorithm_upd_["iterations"] / 5) + 1) == 0:
+                if iter_no % verbose_step == 0:
                     print(
                         "ADMM iteration (",
                         iter_no + 1,
@@ -782,22 +858,12 @@ class RecToolsIR:
                 print("ADMM stopped at iteration (", iter_no + 1, ")")
 
             # stopping criteria (checked after reasonable number of iterations)
-            if iter_no > 5:
-                nrm = xp.linalg.norm(X - X_old) * denomN
-                if nrm < _algorithm_upd_["tolerance"]:
+            if (_algorithm_upd_["tolerance"] > 0.0) and (iter_no > 5):
+                xp.subtract(X, X_old, out=diff_buf)
+                if xp.dot(diff_buf, diff_buf) < tolerance_sq:
                     print("ADMM stopped at iteration (", iter_no, ")")
                     break
-        if self.geom == "2D":
-            return X.reshape([self.Atools.recon_size, self.Atools.recon_size])
-        if self.geom == "3D":
-            return X.reshape(
-                [
-                    self.Atools.detectors_y,
-                    self.Atools.recon_size,
-                    self.Atools.recon_size,
-                ]
-            )
-        return X
+        return X.reshape(recon_shape)
 
 
 # *****************************ADMM ends here*********************************#
@@ -10,14 +10,19 @@ from typing import Union
 
 try:
     import cupy as cp
+
+    # fused element-wise SIRT steps, each array is read and written once per
+    # iteration. The kernels are compiled on their first call and then cached.
+    _sirt_residual = cp.ElementwiseKernel(
+        "float32 b, float32 R", "float32 res", "res = R * (b - res)", "sirt_residual"
+    )
+    _sirt_update = cp.ElementwiseKernel(
+        "float32 bp, float32 C", "float32 x", "x += C * bp", "sirt_update"
+    )
 except ImportError:
     print(
         "Cupy library is a required dependency for this part of the code, please install"
     )
-try:
-    import astra
-except ImportError:
-    print("____! Astra-toolbox package is missing, please install !____")
 
 from tomobar.supp.dicts import dicts_check, _reinitialise_atools_OS
 from tomobar.regularisersCuPy import prox_regul
@@ -85,6 +90,7 @@ class RecToolsIRCuPy(RecToolsIR):
             cp.ndarray: The Landweber-reconstructed volume as a CuPy array.
         """
         cp._default_memory_pool.free_all_blocks()
+        cp.get_default_pinned_memory_pool().free_all_blocks()
         ######################################################################
         # parameters check and initialisation
         (_data_upd_, _algorithm_upd_, _regularisation_upd_) = dicts_check(
@@ -95,19 +101,19 @@ class RecToolsIRCuPy(RecToolsIR):
         _data_["projection_norm_data"] = cp.ascontiguousarray(
             _data_["projection_norm_data"]
         )
-        x_rec = cp.zeros(
-            astra.geom_size(self.Atools.vol_geom), dtype=cp.float32
-        )  # initialisation
+        x_rec = cp.zeros(self.Atools.vol_size, dtype=cp.float32)  # initialisation
+        # the projection and back-projection buffers are reused in every iteration
+        residual = cp.empty(self.Atools.proj_size, dtype=cp.float32)
+        x_update = cp.empty_like(x_rec)
 
         for iter_no in range(_algorithm_upd_["iterations"]):
-            residual = (
-                self.Atools._forwprojCuPy(x_rec) - _data_upd_["projection_norm_data"]
-            )  # Ax - b term
-            x_rec -= _algorithm_upd_["tau_step_lanweber"] * self.Atools._backprojCuPy(
-                residual
-            )
+            residual = self.Atools._forwprojCuPy(x_rec, out=residual)
+            residual -= _data_upd_["projection_norm_data"]  # Ax - b term
+            x_update = self.Atools._backprojCuPy(residual, out=x_update)
+            x_update *= _algorithm_upd_["tau_step_lanweber"]
+            x_rec -= x_update
             if _algorithm_upd_["nonnegativity"]:
-                x_rec[x_rec < 0.0] = 0.0
+                cp.maximum(x_rec, 0.0, out=x_rec)
         return x_rec
 
     def SIRT(self, _data_: dict, _algorithm_: Union[dict, None] = None) -> cp.ndarray:
@@ -124,6 +130,7 @@ class RecToolsIRCuPy(RecToolsIR):
         """
         ######################################################################
         cp._default_memory_pool.free_all_blocks()
+        cp.get_default_pinned_memory_pool().free_all_blocks()
         # parameters check and initialisation
         (_data_upd_, _algorithm_upd_, _regularisation_upd_) = dicts_check(
             self, _data_, _algorithm_, method_run="SIRT"
@@ -135,29 +142,27 @@ class RecToolsIRCuPy(RecToolsIR):
         )
         # prepearing preconditioning matrices R and C
         R = 1 / self.Atools._forwprojCuPy(
-            cp.ones(astra.geom_size(self.Atools.vol_geom), dtype=np.float32)
+            cp.ones(self.Atools.vol_size, dtype=np.float32)
         )
         R = cp.minimum(R, 1 / epsilon)
         C = 1 / self.Atools._backprojCuPy(
-            cp.ones(astra.geom_size(self.Atools.proj_geom), dtype=np.float32)
+            cp.ones(self.Atools.proj_size, dtype=np.float32)
         )
         C = cp.minimum(C, 1 / epsilon)
 
-        x_rec = cp.zeros(
-            astra.geom_size(self.Atools.vol_geom), dtype=np.float32
-        )  # initialisation
+        x_rec = cp.zeros(self.Atools.vol_size, dtype=np.float32)  # initialisation
+        # the projection and back-projection buffers are reused in every iteration
+        residual = cp.empty(self.Atools.proj_size, dtype=np.float32)
+        x_update = cp.empty_like(x_rec)
 
         # perform iterations
         for iter_no in range(_algorithm_upd_["iterations"]):
-            x_rec += C * self.Atools._backprojCuPy(
-                R
-                * (
-                    _data_upd_["projection_norm_data"]
-                    - self.Atools._forwprojCuPy(x_rec)
-                )
-            )
+            residual = self.Atools._forwprojCuPy(x_rec, out=residual)
+            _sirt_residual(_data_upd_["projection_norm_data"], R, residual)
+            x_update = self.Atools._backprojCuPy(residual, out=x_update)
+            _sirt_update(x_update, C, x_rec)
             if _algorithm_upd_["nonnegativity"]:
-                x_rec[x_rec < 0.0] = 0.0
+                cp.maximum(x_rec, 0.0, out=x_rec)
         return x_rec
 
     def CGLS(self, _data_: dict, _algorithm_: Union[dict, None] = None) -> cp.ndarray:
@@ -172,6 +177,7 @@ class RecToolsIRCuPy(RecToolsIR):
             cp.ndarray: The CGLS-reconstructed volume as a CuPy array.
         """
         cp._default_memory_pool.free_all_blocks()
+        cp.get_default_pinned_memory_pool().free_all_blocks()
         ######################################################################
         # parameters check and initialisation
         (_data_upd_, _algorithm_upd_, _regularisation_upd_) = dicts_check(
@@ -184,9 +190,7 @@ class RecToolsIRCuPy(RecToolsIR):
         data_shape_3d = cp.shape(data_input)
 
         # Prepare for CG iterations.
-        x_rec = cp.zeros(
-            astra.geom_size(self.Atools.vol_geom), dtype=cp.float32
-        )  # initialisation
+        x_rec = cp.zeros(self.Atools.vol_size, dtype=cp.float32)  # initialisation
         x_shape_3d = cp.shape(x_rec)
         x_rec = cp.ravel(x_rec, order="C")  # vectorise
         d = self.Atools._backprojCuPy(data_input)
@@ -214,7 +218,7 @@ class RecToolsIRCuPy(RecToolsIR):
             normr2 = normr2_new.copy()
             d = s + beta * d
             if _algorithm_upd_["nonnegativity"]:
-                x_rec[x_rec < 0.0] = 0.0
+                cp.maximum(x_rec, 0.0, out=x_rec)
 
         del d, s, beta, r, alpha, Ad, normr2_new, normr2
         return cp.reshape(x_rec, newshape=x_shape_3d, order="C")
@@ -230,6 +234,7 @@ class RecToolsIRCuPy(RecToolsIR):
             float: the Lipschitz constant
         """
         cp._default_memory_pool.free_all_blocks()
+        cp.get_default_pinned_memory_pool().free_all_blocks()
         # numpy-cupy agnostic function
         return super().powermethod(_data_)
 
@@ -254,17 +259,22 @@ class RecToolsIRCuPy(RecToolsIR):
             cp.ndarray: FISTA-reconstructed 3D cupy array
         """
         cp._default_memory_pool.free_all_blocks()
+        cp.get_default_pinned_memory_pool().free_all_blocks()
         if self.geom == "2D":
             # 2D reconstruction
             raise ValueError("2D CuPy reconstruction is not yet supported")
         # initialise the solution
-        X = cp.zeros(astra.geom_size(self.Atools.vol_geom), dtype=cp.float32)
+        X = cp.zeros(self.Atools.vol_size, dtype=cp.float32)
 
         (_data_upd_, _algorithm_upd_, _regularisation_upd_) = dicts_check(
             self, _data_, _algorithm_, _regularisation_, method_run="FISTA"
         )
 
         if _data_upd_["OS_number"] > 1:
+            if self.datafidelity not in {"LS", "PWLS"}:
+                raise ValueError(
+                    "OS FISTA with CuPy supports only LS and PWLS data fidelities"
+                )
             _data_upd_ = _reinitialise_atools_OS(self, _data_upd_)
 
         L_const_inv = cp.float32(
@@ -275,9 +285,22 @@ class RecToolsIRCuPy(RecToolsIR):
         _data_upd_["projection_norm_data"] = cp.ascontiguousarray(
             _data_upd_["projection_norm_data"]
         )
+        if self.datafidelity == "PWLS":
+            _data_upd_["projection_raw_data"] = cp.asarray(
+                _data_upd_["projection_raw_data"]
+            )
+
+        if _data_upd_["OS_number"] > 1:
+            # keep the indices of subsets on the device to avoid host-device transfers
+            indVec_OS = [cp.asarray(indVec) for indVec in self.Atools.indVec_OS]
 
         t = cp.float32(1.0)
+        updates_no = 0  # the number of (subset) updates for the CD momentum
         X_t = cp.copy(X)
+        # the back-projection buffer is reused in every (sub)iteration
+        grad_fidelity = cp.empty_like(X)
+        if _algorithm_upd_["fista_mode"] == "restart":
+            diff_buf = cp.empty_like(X)
         # FISTA iterations
         for iter_no in range(_algorithm_upd_["iterations"]):
             # loop over subsets (OS)
@@ -286,43 +309,48 @@ class RecToolsIRCuPy(RecToolsIR):
                 t_old = t
                 if _data_upd_["OS_number"] > 1:
                     # select a specific set of indeces for the subset (OS)
-                    indVec = self.Atools.newInd_Vec[sub_ind, :]
-                    if indVec[self.Atools.NumbProjBins - 1] == 0:
-                        indVec = indVec[:-1]  # shrink vector size
+                    indVec = indVec_OS[sub_ind]
+                    # the residual is formed in place of the forward projection
                     if self.datafidelity == "LS":
                         # 3D Least-squares (LS) data fidelity - OS (linear)
-                        res = (
-                            self.Atools._forwprojOSCuPy(X_t, sub_ind)
-                            - _data_upd_["projection_norm_data"][:, indVec, :]
-                        )
-                    if self.datafidelity == "PWLS":
+                        res = self.Atools._forwprojOSCuPy(X_t, sub_ind)
+                        res -= _data_upd_["projection_norm_data"][:, indVec, :]
+                    elif self.datafidelity == "PWLS":
                         # 3D Penalised Weighted Least-squares - OS data fidelity (approximately linear)
-                        res = np.multiply(
-                            _data_upd_["projection_raw_data"][:, indVec, :],
-                            (
-                                self.Atools._forwprojOSCuPy(X_t, sub_ind)
-                                - _data_upd_["projection_norm_data"][:, indVec, :]
-                            ),
-                        )
+                        res = self.Atools._forwprojOSCuPy(X_t, sub_ind)
+                        res -= _data_upd_["projection_norm_data"][:, indVec, :]
+                        res *= _data_upd_["projection_raw_data"][:, indVec, :]
                     # OS reduced gradient
-                    grad_fidelity = self.Atools._backprojOSCuPy(res, sub_ind)
+                    grad_fidelity = self.Atools._backprojOSCuPy(
+                        res, sub_ind, out=grad_fidelity
+                    )
                 else:
                     # full gradient
-                    res = (
-                        self.Atools._forwprojCuPy(X_t)
-                        - _data_upd_["projection_norm_data"]
-                    )
-                    grad_fidelity = self.Atools._backprojCuPy(res)
+                    res = self.Atools._forwprojCuPy(X_t)
+                    res -= _data_upd_["projection_norm_data"]
+                    grad_fidelity = self.Atools._backprojCuPy(res, out=grad_fidelity)
 
                 X = X_t - L_const_inv * grad_fidelity
 
                 if _algorithm_upd_["nonnegativity"]:
-                    X[X < 0.0] = 0.0
+                    cp.maximum(X, 0.0, out=X)
 
                 if _regularisation_upd_["method"] is not None:
                     ##### The proximal operator of the chosen regulariser #####
                     X = prox_regul(self, X, _regularisation_upd_)
 
-                t = cp.float32((1.0 + np.sqrt(1.0 + 4.0 * t**2)) * 0.5)
+                if _algorithm_upd_["fista_mode"] == "restart":
+                    # gradient-based adaptive restart: the momentum is dropped when
+                    # it points against the descent direction
+                    cp.subtract(X, X_old, out=diff_buf)
+                    X_t -= X
+                    if cp.vdot(X_t, diff_buf) > 0.0:
+                        t_old = t = cp.float32(1.0)
+                if _algorithm_upd_["fista_mode"] == "CD":
+                    # Chambolle-Dossal rule t_k = (k + a - 1) / a with a = 4
+                    updates_no += 1
+                    t = cp.float32((updates_no + 4.0) / 4.0)
+                else:
+                    t = cp.float32((1.0 + np.sqrt(1.0 + 4.0 * t**2)) * 0.5)
                 X_t = X + cp.float32((t_old - 1.0) / t) * (X - X_old)
         return X
@@ -31,6 +31,51 @@ except ImportError:
     pass
 
 
+def _regulariser_device(self, _regularisation_: dict) -> Union[str, int]:
+    """Selects the device for the regulariser. 'gpu' follows the device of the projector,
+    'cpu' or a GPU index (integer) are passed to the CCPi-regularisation toolkit as given.
+
+    Args:
+        _regularisation_ (dict): Regularisation dictionary with parameters.
+
+    Returns:
+        str or int: 'cpu' or the GPU index.
+    """
+    device = _regularisation_["device_regulariser"]
+    if device == "gpu":
+        return self.Atools.device_index
+    return device
+
+
+def _parallel_tv_prox(X: np.ndarray, regul_param: float) -> np.ndarray:
+    """Approximates the proximal operator of the anisotropic TV with the parallel
+    proximal algorithm of Kamilov: the soft-thresholding of the undecimated
+    (cycle-spun) Haar differences along every axis, with periodic boundaries.
+    It has no inner iterations, unlike the iterative CCPi-RGL TV methods. CuPy arrays
+    are also accepted as NumPy dispatches the calls to CuPy.
+
+    Args:
+        X (np.ndarray): 2D or 3D numpy (or CuPy) array.
+        regul_param (float): The regularisation parameter.
+
+    Returns:
+        np.ndarray: Filtered 2D or 3D numpy array.
+    """
+    ndim = X.ndim
+    threshold = 2.0 * ndim * regul_param
+    X_prox = np.zeros_like(X)
+    for axis in range(ndim):
+        X_next = np.roll(X, -1, axis=axis)
+        avg = 0.5 * (X + X_next)
+        diff = 0.5 * (X - X_next)
+        diff = np.maximum(np.abs(diff) - threshold, 0.0) * np.sign(diff)
+        # both Haar shifts are synthesised and averaged
+        X_prox += avg + diff
+        X_prox += np.roll(avg - diff, 1, axis=axis)
+    X_prox *= 0.5 / ndim
+    return X_prox
+
+
 def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray, tuple]:
     """Enabling proximal operators step in interative reconstruction.
 
@@ -42,6 +87,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
         np.ndarray or a tuple: Filtered 2D or 3D numpy array or a tuple.
     """
     info_vec = (_regularisation_["iterations"], 0)
+    device = _regulariser_device(self, _regularisation_)
     # The proximal operator of the chosen regulariser
     if "ROF_TV" in _regularisation_["method"]:
         # Rudin - Osher - Fatemi Total variation method
@@ -51,7 +97,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["iterations"],
             _regularisation_["time_marching_step"],
             _regularisation_["tolerance"],
-            self.Atools.device_index,
+            device,
         )
     if "FGP_TV" in _regularisation_["method"]:
         # Fast-Gradient-Projection Total variation method
@@ -62,7 +108,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["tolerance"],
             _regularisation_["methodTV"],
             self.nonneg_regul,
-            self.Atools.device_index,
+            device,
         )
     if "PD_TV" in _regularisation_["method"]:
         # Primal-Dual (PD) Total variation method by Chambolle-Pock
@@ -74,7 +120,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["methodTV"],
             self.nonneg_regul,
             _regularisation_["PD_LipschitzConstant"],
-            self.Atools.device_index,
+            device,
         )
     if "SB_TV" in _regularisation_["method"]:
         # Split Bregman Total variation method
@@ -84,7 +130,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["iterations"],
             _regularisation_["tolerance"],
             _regularisation_["methodTV"],
-            self.Atools.device_index,
+            device,
         )
     if "LLT_ROF" in _regularisation_["method"]:
         # Lysaker-Lundervold-Tai + ROF Total variation method
@@ -95,7 +141,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["iterations"],
             _regularisation_["time_marching_step"],
             _regularisation_["tolerance"],
-            self.Atools.device_index,
+            device,
         )
     if "TGV" in _regularisation_["method"]:
         # Total Generalised Variation method
@@ -107,7 +153,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["iterations"],
             _regularisation_["PD_LipschitzConstant"],
             _regularisation_["tolerance"],
-            self.Atools.device_index,
+            device,
         )
     if "NDF" in _regularisation_["method"]:
         # Nonlinear isotropic diffusion method
@@ -119,7 +165,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["time_marching_step"],
             self.NDF_method,
             _regularisation_["tolerance"],
-            self.Atools.device_index,
+            device,
         )
     if "Diff4th" in _regularisation_["method"]:
         # Anisotropic diffusion of higher order
@@ -130,7 +176,7 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["iterations"],
             _regularisation_["time_marching_step"],
             _regularisation_["tolerance"],
-            self.Atools.device_index,
+            device,
         )
     if "NLTV" in _regularisation_["method"]:
         # Non-local Total Variation
@@ -143,6 +189,9 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             _regularisation_["regul_param"],
             _regularisation_["iterations"],
         )
+    if "PARALLEL_TV" in _regularisation_["method"]:
+        # Haar-shrinkage approximation of the TV proximal operator (no inner iterations)
+        X = _parallel_tv_prox(X, _regularisation_["regul_param"])
     if "WAVELETS" in _regularisation_["method"]:
         if X.ndim == 2:
             W = Wavelets(X, "db5", 3)
@@ -151,8 +200,11 @@ def prox_regul(self, X: np.ndarray, _regularisation_: dict) -> Union[np.ndarray,
             W.inverse()
             X = W.image
         else:
+            # one transform object (and its device buffers) is reused for all slices
+            W = Wavelets(X[0, :, :], "db5", 3)
             for i in range(np.shape(X)[0]):
-                W = Wavelets(X[i, :, :], "db5", 3)
+                if i > 0:
+                    W.set_image(X[i, :, :])
                 W.forward()
                 W.soft_threshold(_regularisation_["regul_param2"])
                 W.inverse()
@@ -6,6 +6,8 @@ initiate proximity operator for iterative methods.
 
 import cupy as cp
 
+from tomobar.regularisers import _parallel_tv_prox
+
 try:
     from ccpi.filters.regularisersCuPy import ROF_TV as ROF_TV_cupy
     from ccpi.filters.regularisersCuPy import PD_TV as PD_TV_cupy
@@ -49,4 +51,7 @@ def prox_regul(self, X: cp.ndarray, _regularisation_: dict) -> cp.ndarray:
             _regularisation_["PD_LipschitzConstant"],
             self.Atools.device_index,
         )
+    if "PARALLEL_TV" in _regularisation_["method"]:
+        # Haar-shrinkage approximation of TV, it does not need the toolkit
+        X_prox = _parallel_tv_prox(X, _regularisation_["regul_param"])
     return X_prox
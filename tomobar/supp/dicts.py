@@ -53,13 +53,18 @@ def dicts_check(
         _algorithm_['recon_mask_radius'] (float): Enables a circular mask cutoff in the reconstructed image. Defaults to 1.0.
         _algorithm_['initialise'] (ndarray): Initialise an algorithm with an array.
         _algorithm_['lipschitz_const'] (float): Lipschitz constant for the FISTA algorithm. If not provided it will be calculated for each method call.
+        _algorithm_['fista_mode'] (str): The update rule of the FISTA momentum: "regular", "CD" (Chambolle-Dossal) or "restart" (adaptive restart). Defaults to "regular".
         _algorithm_['ADMM_rho_const'] (float): Augmented Lagrangian parameter for the ADMM algorithm.
         _algorithm_['ADMM_relax_par'] (float): Over relaxation parameter for the convergence acceleration of the ADMM algorithm.
+        _algorithm_['ADMM_solver'] (str): The solver of the ADMM quadratic subproblem: "gmres" or "cg" (conjugate gradients). Defaults to "gmres".
+        _algorithm_['ADMM_rho_adaptive'] (bool): Adapt the ADMM_rho_const during the iterations by balancing the primal and dual residuals. Defaults to False.
+        _algorithm_['ADMM_anderson_depth'] (int): The number of previous iterates used by Anderson acceleration of ADMM, 0 disables it. Defaults to 0.
         _algorithm_['tolerance'] (float): Tolerance to terminate reconstruction algorithm iterations earlier. Defaults to 0.0.
         _algorithm_['verbose'] (bool): Switch on printing of iterations number and other messages. Defaults to False.
 
         _regularisation_['method'] (str): Select the regularisation method from the CCPi-regularisation toolkit. The supported
                 methods listed: ROF_TV, FGP_TV, PD_TV, SB_TV, LLT_ROF, TGV, NDF, Diff4th, NLTV.
+                PARALLEL_TV is a fast Haar-shrinkage approximation of TV which does not need the toolkit.
                 If one also installed `pypwt` package for Wavelets then one can WAVELET regularisation by adding WAVELETS to any method above
                 by appending "_WAVELETS" string to an existing regulariser. For instance, ROF_TV_WAVELETS would enable dual regularisation with ROF_TV
                 and wavelets.
@@ -134,11 +139,11 @@ def dicts_check(
             if self.datafidelity == "SWLS":
                 if _data_.get("beta_SWLS") is None:
                     # SWLS related parameter (ring supression)
-                    _data_["beta_SWLS"] = 0.1 * np.ones(self.Atools.detectors_x)
-                else:
-                    _data_["beta_SWLS"] = _data_["beta_SWLS"] * np.ones(
-                        self.Atools.detectors_x
-                    )
+                    _data_["beta_SWLS"] = 0.1
+                # a scalar or a per-detector parameter is filled in one pass
+                _data_["beta_SWLS"] = np.full(
+                    self.Atools.detectors_x, _data_["beta_SWLS"], dtype=np.float32
+                )
             # Huber data model to supress artifacts
             if "huber_threshold" not in _data_:
                 _data_["huber_threshold"] = None
@@ -174,6 +179,11 @@ def dicts_check(
                 _algorithm_["iterations"] = 20  # Ordered - Subsets
             else:
                 _algorithm_["iterations"] = 400  # Classical
+        # the update rule of the FISTA momentum
+        if "fista_mode" not in _algorithm_:
+            _algorithm_["fista_mode"] = "regular"
+        if _algorithm_["fista_mode"] not in {"regular", "CD", "restart"}:
+            raise NameError("For fista_mode choose regular, CD or restart")
     if _algorithm_.get("lipschitz_const") is None:
         # if not provided calculate Lipschitz constant automatically
         _algorithm_["lipschitz_const"] = self.powermethod(_data_)
@@ -184,6 +194,17 @@ def dicts_check(
         # ADMM over-relaxation parameter to accelerate convergence
         if "ADMM_relax_par" not in _algorithm_:
             _algorithm_["ADMM_relax_par"] = 1.0
+        # the linear solver of the ADMM quadratic subproblem
+        if "ADMM_solver" not in _algorithm_:
+            _algorithm_["ADMM_solver"] = "gmres"
+        if _algorithm_["ADMM_solver"] not in {"gmres", "cg"}:
+            raise NameError("For ADMM_solver choose gmres or cg")
+        # ADMM residual balancing of the augmented Lagrangian parameter
+        if "ADMM_rho_adaptive" not in _algorithm_:
+            _algorithm_["ADMM_rho_adaptive"] = False
+        # ADMM Anderson acceleration depth (0 - plain ADMM)
+        if "ADMM_anderson_depth" not in _algorithm_:
+            _algorithm_["ADMM_anderson_depth"] = 0
     # initialise an algorithm with an array
     if "initialise" not in _algorithm_:
         _algorithm_["initialise"] = None
@@ -269,10 +290,14 @@ def _reinitialise_atools_OS(self, _data_: dict):
     """reinitialises OS geometry by overwriting the existing Atools
        Note: Not an ideal thing to do as it can lead to various problems,
        worth considering moving the subsets definition to the class init.
+       The existing Atools (and its ASTRA projectors) are reused if the number
+       of subsets has not changed, e.g. for powermethod followed by FISTA.
 
     Args:
         _data_ (dict): data dictionary
     """
+    if self.Atools.ordsub_number == _data_["OS_number"]:
+        return _data_
 
     if self.geom == "2D":
         self.Atools = AstraTools2D(
@@ -25,64 +25,44 @@ def _vec_geom_init2D(
     angles_rad: np.ndarray, CenterRotOffset: Union[float, List]
 ) -> np.ndarray:
     DetectorSpacingX = 1.0
-    s0 = [0.0, -1.0]  # source
-    u0 = [DetectorSpacingX, 0.0]  # detector coordinates
+    # the rotation is applied to all angles at once, a scalar CoR is broadcasted
+    cos_theta = np.cos(angles_rad).astype(np.float64)
+    sin_theta = np.sin(angles_rad).astype(np.float64)
+    CenterRotOffset = np.asarray(CenterRotOffset)
     vectors = np.zeros([angles_rad.size, 6])
-    for i in range(0, angles_rad.size):
-        if np.ndim(CenterRotOffset) == 0:
-            d0 = [CenterRotOffset, 0.0]  # detector
-        else:
-            d0 = [CenterRotOffset[i], 0.0]  # detector
-        theta = angles_rad[i]
-        vec_temp = np.dot(__rotation_matrix2D(theta), s0)
-        vectors[i, 0:2] = vec_temp[:]  # ray position
-        vec_temp = np.dot(__rotation_matrix2D(theta), d0)
-        vectors[i, 2:4] = vec_temp[:]  # center of detector position
-        vec_temp = np.dot(__rotation_matrix2D(theta), u0)
-        vectors[i, 4:6] = vec_temp[:]  # detector pixel (0,0) to (0,1).
+    vectors[:, 0] = sin_theta  # ray position
+    vectors[:, 1] = -cos_theta
+    vectors[:, 2] = cos_theta * CenterRotOffset  # center of detector position
+    vectors[:, 3] = sin_theta * CenterRotOffset
+    vectors[:, 4] = cos_theta * DetectorSpacingX  # detector pixel (0,0) to (0,1).
+    vectors[:, 5] = sin_theta * DetectorSpacingX
     return vectors
 
 
 # define 3D vector geometry
 def _vec_geom_init3D(angles_rad, DetectorSpacingX, DetectorSpacingY, CenterRotOffset):
-    s0 = [0.0, -1.0, 0.0]  # source
-    u0 = [DetectorSpacingX, 0.0, 0.0]  # detector coordinates
-    v0 = [0.0, 0.0, DetectorSpacingY]  # detector coordinates
+    # the rotation is applied to all angles at once, a scalar CoR is broadcasted
+    cos_theta = np.cos(angles_rad).astype(np.float64)
+    sin_theta = np.sin(angles_rad).astype(np.float64)
+    if np.ndim(CenterRotOffset) == 0:
+        CenterRotOffsetX = CenterRotOffset
+        CenterRotOffsetZ = 0.0
+    else:
+        CenterRotOffsetX = CenterRotOffset[:, 0]
+        CenterRotOffsetZ = CenterRotOffset[:, 1]
 
     vectors = np.zeros([angles_rad.size, 12])
-    for i in range(0, angles_rad.size):
-        if np.ndim(CenterRotOffset) == 0:
-            d0 = [CenterRotOffset, 0.0, 0.0]  # detector
-        else:
-            d0 = [CenterRotOffset[i, 0], 0.0, CenterRotOffset[i, 1]]  # detector
-        theta = angles_rad[i]
-        vec_temp = np.dot(__rotation_matrix3D(theta), s0)
-        vectors[i, 0:3] = vec_temp[:]  # ray position
-        vec_temp = np.dot(__rotation_matrix3D(theta), d0)
-        vectors[i, 3:6] = vec_temp[:]  # center of detector position
-        vec_temp = np.dot(__rotation_matrix3D(theta), u0)
-        vectors[i, 6:9] = vec_temp[:]  # detector pixel (0,0) to (0,1).
-        vec_temp = np.dot(__rotation_matrix3D(theta), v0)
-        vectors[i, 9:12] = vec_temp[:]  # Vector from detector pixel (0,0) to (1,0)
+    vectors[:, 0] = sin_theta  # ray position
+    vectors[:, 1] = -cos_theta
+    vectors[:, 3] = cos_theta * CenterRotOffsetX  # center of detector position
+    vectors[:, 4] = sin_theta * CenterRotOffsetX
+    vectors[:, 5] = CenterRotOffsetZ
+    vectors[:, 6] = cos_theta * DetectorSpacingX  # detector pixel (0,0) to (0,1).
+    vectors[:, 7] = sin_theta * DetectorSpacingX
+    vectors[:, 11] = DetectorSpacingY  # Vector from detector pixel (0,0) to (1,0)
     return vectors
 
 
-# define 2D rotation matrix
-def __rotation_matrix2D(theta):
-    return np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
-
-
-# define 3D rotation matrix
-def __rotation_matrix3D(theta):
-    return np.array(
-        [
-            [np.cos(theta), -np.sin(theta), 0.0],
-            [np.sin(theta), np.cos(theta), 0.0],
-            [0.0, 0.0, 1.0],
-        ]
-    )
-
-
 def __get_swap_tuple(data_axis_labels, labels_order):
     swap_tuple = None
     for in_l1, str_1 in enumerate(labels_order):
@@ -151,14 +131,11 @@ def _data_swap(data: xp.ndarray, data_swap_list: list) -> xp.ndarray:
     Returns:
         xp.ndarray: swapped array to the desired format
     """
+    xpp = xp.get_array_module(data) if cupy_enabled else np
     for swap_tuple in data_swap_list:
         if swap_tuple is not None:
-            if cupy_enabled:
-                xpp = xp.get_array_module(data)
-                return xpp.swapaxes(data, swap_tuple[0], swap_tuple[1])
-            else:
-                return np.swapaxes(data, swap_tuple[0], swap_tuple[1])
-        return data
+            data = xpp.swapaxes(data, swap_tuple[0], swap_tuple[1])
+    return data
 
 
 def _parse_device_argument(device_int_or_string):
@@ -188,9 +165,18 @@ def _data_dims_swapper(
         required_labels_order (list): The required data axes.
 
     Returns:
-        xp.ndarray: An array with swapped (or not) axes.
+        xp.ndarray: An array with swapped (or not) axes, C-contiguous if swapped.
     """
     data_swap_list = _swap_data_axes_to_accepted(
         data_axes_labels_order, required_labels_order
     )
-    return _data_swap(data, data_swap_list)
+    swapped_data = _data_swap(data, data_swap_list)
+    if swapped_data is not data:
+        # reorder the memory once here rather than in every projection call later
+        if cupy_enabled:
+            swapped_data = xp.get_array_module(swapped_data).ascontiguousarray(
+                swapped_data
+            )
+        else:
+            swapped_data = np.ascontiguousarray(swapped_data)
+    return swapped_data
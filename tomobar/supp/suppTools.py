@@ -13,6 +13,7 @@ List of functions:
 
 import numpy as np
 import typing
+from functools import lru_cache
 from typing import Union
 
 try:
@@ -401,25 +402,29 @@ def _check_kwargs(reconstruction, **kwargs):
     return reconstruction
 
 
-def circ_mask(X, diameter):
+@lru_cache(maxsize=8)
+def _circ_mask_array(objsize: int, diameter: float) -> np.ndarray:
+    # the mask depends only on the object size and the diameter, so it is cached
+    c = np.linspace(
+        -(objsize * (1.0 / diameter)) / 2.0, (objsize * (1.0 / diameter)) / 2.0, objsize
+    )
+    x, y = np.meshgrid(c, c)
+    mask = np.float32(np.array((x**2 + y**2 < (objsize / 2.0) ** 2)))
+    mask.flags.writeable = False
+    return mask
+
+
+def circ_mask(X, diameter, out=None):
     # applying a circular mask to the reconstructed image/volume
     # Make the 'diameter' smaller than 1.0 in order to shrink it
+    # The mask is applied in-place if out=X is given
     obj_shape = np.shape(X)
-    X_masked = np.float32(np.zeros(obj_shape))
     if np.ndim(X) == 2:
         objsize = obj_shape[0]
     elif np.ndim(X) == 3:
         objsize = obj_shape[1]
     else:
         print("Object input size is wrong for the mask to apply to")
-    c = np.linspace(
-        -(objsize * (1.0 / diameter)) / 2.0, (objsize * (1.0 / diameter)) / 2.0, objsize
-    )
-    x, y = np.meshgrid(c, c)
-    mask = np.float32(np.array((x**2 + y**2 < (objsize / 2.0) ** 2)))
-    if np.ndim(X) == 3:
-        for z in range(0, obj_shape[0]):
-            X_masked[z, :, :] = np.multiply(X[z, :, :], mask)
-    else:
-        X_masked = np.multiply(X, mask)
-    return X_masked
+    mask = _circ_mask_array(objsize, diameter)
+    # the 2D mask is broadcasted over the slices of a volume
+    return np.multiply(X, mask, out=out)